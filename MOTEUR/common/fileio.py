@@ -1,6 +1,9 @@
 from __future__ import annotations
+import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
 try:
     from localapp.log_safe import open_utf8
@@ -8,6 +11,61 @@ except ImportError:
     from log_safe import open_utf8
 
 
+def read_lines_txt(path: str | Path) -> list[str]:
+    """
+    Lit un fichier texte (une entrée par ligne) et retourne les lignes
+    non vides, sans espaces parasites.
+    Le fichier est lu en binaire puis décodé en une seule fois : bien plus
+    rapide que l'itération ligne à ligne en mode texte sur les gros fichiers.
+    Gère indifféremment LF / CRLF.
+    """
+    text = Path(path).read_bytes().decode("utf-8", errors="replace")
+    return [s for s in (ln.strip() for ln in text.splitlines()) if s]
+
+
+def write_bytes_atomic(path: str | Path, data: bytes, *, fsync: bool = False) -> None:
+    """
+    Écrit ``data`` de façon atomique : fichier temporaire voisin propre à
+    chaque appel, puis ``os.replace``. Un lecteur ne voit jamais de fichier
+    à moitié écrit et deux écrivains simultanés ne partagent pas de fichier
+    temporaire. ``fsync=True`` force en plus l'écriture sur disque (données
+    utilisateur rarement écrites) ; laissé désactivé pour l'historique,
+    écrit à chaque URL.
+    """
+    p = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=p.name + ".", suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp crée en 0600 : on garde les droits du fichier remplacé
+        try:
+            mode = os.stat(p).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        os.replace(tmp, p)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(
+    path: str | Path, data: Any, *, indent: int | None = 2, fsync: bool = False
+) -> None:
+    """
+    Écrit ``data`` en JSON (UTF-8) via :func:`write_bytes_atomic` :
+    sérialisation unique puis remplacement atomique du fichier.
+    """
+    payload = json.dumps(data, indent=indent, ensure_ascii=False)
+    write_bytes_atomic(path, payload.encode("utf-8", errors="replace"), fsync=fsync)
+
+
 def write_lines_txt(path: str | Path, lines: Iterable[str]) -> str:
     """
     Écrit des lignes texte en UTF-8, avec des retours Windows (CRLF)
@@ -8,6 +8,8 @@ try:
 except ImportError:
     from log_safe import open_utf8
 
+from ..common.fileio import write_json_atomic
+
 # Path to the history log file at project root
 HISTORY_FILE = Path(__file__).resolve().parents[2] / "scraping_history.json"
 
@@ -26,8 +28,7 @@ def _read_json(path: Path) -> List[Dict]:
 
 
 def _write_json(path: Path, data) -> None:
-    with open_utf8(path, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_json_atomic(path, data)
 
 
 def log_scrape(url: str, profile: str, images: int, folder: str) -> None:
@@ -123,6 +123,15 @@ def _release_cached_driver():
 
 atexit.register(_release_cached_driver)
 
+# -------------------- Regex précompilées --------------------
+_PAGE_QUERY_RE = re.compile(r"([?&](?:page|paged)=(\d+))")
+_PAGE_PATH_RE = re.compile(r"/page/(\d+)")
+_CSS_URL_RE = re.compile(r"url\(['\"]?(.*?)['\"]?\)")
+_SIZE_SUFFIX_RE = re.compile(r"-\d+$")
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_SLUG_STRIP_RE = re.compile(r"[^a-zA-Z0-9\s-]")
+_SLUG_SEP_RE = re.compile(r"[\s_-]+")
+
 # -------------------- URL utils (normalisation/validation) --------------------
 _DISALLOWED_SCHEMES = ("blob", "javascript", "mailto", "tel", "about", "chrome")
 
@@ -416,15 +425,15 @@ def infer_pagination_template(url: str) -> tuple[str | None, int]:
     """
     Retourne (template, start_page) si détecté, sinon (None, 1).
     """
-    m = re.search(r"([?&](?:page|paged)=(\d+))", url)
+    m = _PAGE_QUERY_RE.search(url)
     if m:
         full, num = m.groups()
         tpl = url.replace(full, full.split("=")[0] + "={page}")
         return tpl, int(num)
-    m = re.search(r"/page/(\d+)", url)
+    m = _PAGE_PATH_RE.search(url)
     if m:
         num = m.group(1)
-        tpl = re.sub(r"/page/\d+", "/page/{page}", url)
+        tpl = _PAGE_PATH_RE.sub("/page/{page}", url)
         return tpl, int(num)
     return None, 1
 
@@ -712,7 +721,7 @@ def _extract_urls(driver: ChromeDriver, selector: str) -> List[str]:
 
         # Vérifie aussi dans le style (cas d'image en background)
         style = el.get_attribute("style") or ""
-        match = re.search(r"url\(['\"]?(.*?)['\"]?\)", style)
+        match = _CSS_URL_RE.search(style)
         if match:
             url = match.group(1)
             if not url.startswith("data:image"):
@@ -747,9 +756,9 @@ def _download(url: str, folder: Path, session: requests.Session | None = None) -
         return
 
     # --- Normalisation du nom et de l'extension ---
-    orig_name = os.path.basename(url.split("?")[0]) or "image"
+    orig_name = url.partition("?")[0].rpartition("/")[2] or "image"
     stem, orig_ext = os.path.splitext(orig_name)
-    stem = re.sub(r"-\d+$", "", stem)  # nettoie suffixes type "-409"
+    stem = _SIZE_SUFFIX_RE.sub("", stem)  # nettoie suffixes type "-409"
 
     # Choix de l'extension cible
     target_ext = ".webp" if FORCE_WEBP else (orig_ext or ".jpg")
@@ -827,7 +836,7 @@ def _folder_from_url(url: str) -> Path:
     path = unquote(urlparse(url).path)
     name = Path(path).name.replace("-", " ")
     # keep alphanumeric characters, spaces and underscores only
-    name = re.sub(r"[^\w\s]", "", name).strip()
+    name = _NON_WORD_RE.sub("", name).strip()
     return Path(name or "images")
 
 
@@ -837,6 +846,7 @@ def scrape_images(
     folder: Path,
     *,
     keep_driver: bool = False,
+    session: requests.Session | None = None,
     **_unused,
 ) -> int | tuple[int, ChromeDriver]:
     """Scrape les images pour une URL et retourne le nombre téléchargé.
@@ -845,9 +855,11 @@ def scrape_images(
       retourne avec le total téléchargé.
     - ``keep_driver=False`` => crée/ferme un driver si Selenium est nécessaire et
       retourne uniquement le total.
+    - ``session`` : session HTTP partagée entre plusieurs appels (connexions
+      réutilisées) ; à défaut une session est créée pour l'appel.
     """
 
-    session = _make_http_session()
+    session = session or _make_http_session()
     driver = None
     total = 0
     try:
@@ -871,7 +883,19 @@ def scrape_images(
         images = list(dict.fromkeys(clean))[:MAX_IMAGES_PER_PRODUCT]
         total = len(images)
         dest = Path(folder) / _folder_from_url(url)
-        download_many(images, dest, session=session)
+        if keep_driver:
+            # La phase variantes exige le driver sur la page produit : on y
+            # navigue pendant que les téléchargements tournent en parallèle.
+            with ThreadPoolExecutor(max_workers=1) as ex:
+                fut = ex.submit(download_many, images, dest, session)
+                if driver is None:
+                    driver = _get_cached_driver()
+                    driver.get(url)
+                elif _normalize_url(driver.current_url) != url:
+                    driver.get(url)
+                fut.result()
+        else:
+            download_many(images, dest, session=session)
     finally:
         if driver is not None and not keep_driver:
             with suppress(Exception):
@@ -894,8 +918,8 @@ def scrape_variants(driver: ChromeDriver) -> dict[str, str]:
     def _slugify(text: str) -> str:
         text = unicodedata.normalize('NFKD', text)
         text = text.encode('ascii', 'ignore').decode('ascii')
-        text = re.sub(r"[^a-zA-Z0-9\s-]", "", text)
-        text = re.sub(r"[\s_-]+", "-", text).strip("-")
+        text = _SLUG_STRIP_RE.sub("", text)
+        text = _SLUG_SEP_RE.sub("-", text).strip("-")
         return text.lower()
 
     product_path = unquote(urlparse(driver.current_url).path).rstrip("/")
@@ -1,4 +1,5 @@
 import json
+import sys
 from pathlib import Path
 from typing import List, Dict
 
@@ -7,32 +8,65 @@ try:
 except ImportError:
     from log_safe import open_utf8
 
+from ..common.fileio import write_json_atomic
+
 # Path to the JSON file storing profiles. By default it is located at the
 # project root but can be overridden in tests by changing this variable.
 PROFILES_FILE = Path(__file__).resolve().parents[2] / "profiles.json"
 
+# Sélecteur proposé par défaut (galerie WooCommerce). Interné pour que toutes
+# les valeurs « non renseignées » partagent le même objet.
+DEFAULT_SELECTOR = sys.intern(".woocommerce-product-gallery__image a")
+
+
+def coalesce_selector(text: str, default: str = DEFAULT_SELECTOR) -> str:
+    """Return ``text`` stripped, or ``default`` when it is blank."""
+    s = text.strip()
+    return s if s else default
+
+
+# Dernier contenu lu : (chemin, mtime_ns, taille) -> profils parsés.
+_cache_key: tuple | None = None
+_cache_data: List[Dict[str, str]] = []
+
+
+def _invalidate_cache() -> None:
+    global _cache_key
+    _cache_key = None
+
 
 def load_profiles() -> List[Dict[str, str]]:
     """Load scraping profiles from :data:`PROFILES_FILE`.
 
     Returns an empty list if the file does not exist or is empty.
+    The parsed content is cached and only re-read when the file's mtime or
+    size changes; callers always receive fresh copies.
     """
-    if not PROFILES_FILE.exists():
-        return []
+    global _cache_key, _cache_data
+    path = PROFILES_FILE
     try:
-        with open_utf8(PROFILES_FILE, "r") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return [p for p in data if isinstance(p, dict)]
-    except Exception:
-        pass
-    return []
+        st = path.stat()
+    except OSError:
+        return []
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    if key != _cache_key:
+        data: List[Dict[str, str]] = []
+        try:
+            with open_utf8(path, "r") as f:
+                raw = json.load(f)
+            if isinstance(raw, list):
+                data = [p for p in raw if isinstance(p, dict)]
+        except (OSError, ValueError):
+            # fichier illisible ou JSON invalide -> aucun profil
+            pass
+        _cache_key, _cache_data = key, data
+    return [dict(p) for p in _cache_data]
 
 
 def save_profiles(profiles: List[Dict[str, str]]) -> None:
     """Write ``profiles`` to :data:`PROFILES_FILE` in JSON format."""
-    with open_utf8(PROFILES_FILE, "w") as f:
-        json.dump(profiles, f, indent=2, ensure_ascii=False)
+    _invalidate_cache()
+    write_json_atomic(PROFILES_FILE, profiles, fsync=True)
 
 
 def add_profile(name: str, selector: str) -> None:
@@ -14,6 +14,7 @@ from typing import Any, Dict, Optional
 import csv
 import datetime as _dt
 from datetime import datetime
+import io
 import json
 import logging
 import os
@@ -29,7 +30,6 @@ from flask import Flask, request, jsonify, send_file
 from werkzeug.serving import make_server
 from concurrent.futures import ThreadPoolExecutor, Future
 
-from ..image_scraper import scrape_images, scrape_variants
 from ..profile_manager import load_profiles
 from ..history import load_history
 
@@ -37,7 +37,58 @@ from ..history import load_history
 log = logging.getLogger("flask-bridge")
 log.setLevel(logging.INFO)
 
-IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp"}
+IMAGE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+PRODUCT_IMAGE_EXTS = frozenset({".png", ".jpg", ".jpeg", ".webp", ".avif", ".gif"})
+
+
+def _has_ext(name: str, exts: frozenset[str]) -> bool:
+    """Teste l'extension de ``name`` en ne passant en minuscules que celle-ci."""
+    dot = name.rfind(".")
+    return dot != -1 and name[dot:].lower() in exts
+
+
+def _thumb_size(args) -> tuple[int, int] | None:
+    """Lit les paramètres ``w``/``h`` d'une demande de vignette (bornés)."""
+    try:
+        w = int(args.get("w", 0))
+        h = int(args.get("h", 0))
+    except (TypeError, ValueError):
+        return None
+    if w <= 0 or h <= 0:
+        return None
+    return min(w, 1024), min(h, 1024)
+
+
+def _thumbnail_jpeg(path: Path, size: tuple[int, int]) -> io.BytesIO:
+    """Réduit l'image à ``size`` (ratio conservé) et l'encode en JPEG."""
+    from PIL import Image
+
+    with Image.open(path) as im:
+        im.draft("RGB", size)  # décodage JPEG directement à échelle réduite
+        im.thumbnail(size)
+        if im.mode in ("RGBA", "LA", "PA") or (
+            im.mode == "P" and "transparency" in im.info
+        ):
+            # JPEG sans alpha : la transparence est posée sur fond blanc
+            im = im.convert("RGBA")
+            bg = Image.new("RGBA", im.size, (255, 255, 255, 255))
+            bg.paste(im, mask=im.split()[-1])
+            im = bg.convert("RGB")
+        elif im.mode != "RGB":
+            im = im.convert("RGB")
+        buf = io.BytesIO()
+        im.save(buf, "JPEG", quality=85)
+    buf.seek(0)
+    return buf
+
+
+def _image_names(folder: str | Path, exts: frozenset[str] = IMAGE_EXTS) -> list[str]:
+    """Noms des images présentes directement dans ``folder``.
+
+    ``os.scandir`` fournit le type de chaque entrée sans ``stat`` supplémentaire.
+    """
+    with os.scandir(folder) as it:
+        return [e.name for e in it if _has_ext(e.name, exts) and e.is_file()]
 
 
 @dataclass
@@ -211,16 +262,13 @@ class FlaskBridgeServer:
                     400,
                 )
 
-            files = [
-                f.name
-                for f in p.iterdir()
-                if f.is_file() and f.suffix.lower() in image_exts
-            ]
-            base = request.host_url.rstrip("/")
-            urls = [
-                f"{base}/files/raw?folder={quote(raw_folder)}&name={quote(name)}"
-                for name in files
-            ]
+            files = _image_names(p, image_exts)
+            # préfixe commun calculé une seule fois
+            prefix = (
+                f"{request.host_url.rstrip('/')}/files/raw"
+                f"?folder={quote(raw_folder)}&name="
+            )
+            urls = [prefix + quote(name) for name in files]
             return jsonify(
                 {
                     "folder": raw_folder or folder,
@@ -256,7 +304,7 @@ class FlaskBridgeServer:
                     ),
                     404,
                 )
-            if p.suffix.lower() not in image_exts:
+            if not _has_ext(name, image_exts):
                 return (
                     jsonify(
                         {
@@ -266,6 +314,12 @@ class FlaskBridgeServer:
                     ),
                     400,
                 )
+            size = _thumb_size(request.args)
+            if size is not None:
+                try:
+                    return send_file(_thumbnail_jpeg(p, size), mimetype="image/jpeg")
+                except Exception as exc:  # pragma: no cover - image illisible
+                    log.warning("thumbnail failed for %s: %s", p, exc)
             return send_file(str(p), as_attachment=False)
 
         @app.post("/scrape")
@@ -314,9 +368,7 @@ class FlaskBridgeServer:
                     ),
                     400,
                 )
-            has_images = any(
-                pp.suffix.lower() in image_exts for pp in p.iterdir() if pp.is_file()
-            )
+            has_images = bool(_image_names(p, image_exts))
             if not has_images:
                 return (
                     jsonify(
@@ -455,18 +507,17 @@ class FlaskBridgeServer:
         def _images_root() -> Path:
             return Path(IMAGES_ROOT_ABS).resolve()
 
-        def _is_image(p: Path) -> bool:
-            return p.suffix.lower() in (".png",".jpg",".jpeg",".webp",".avif",".gif")
-
         def _product_dirs():
             root = _images_root()
             if not root.exists():
                 return []
-            return [p for p in root.iterdir() if p.is_dir()]
+            with os.scandir(root) as it:
+                return [Path(e.path) for e in it if e.is_dir()]
 
-        def _file_url_for(product_dir: Path, filename: str) -> str:
-            # Sert le fichier via l’endpoint existant /files/raw (folder + name)
-            return f"{BASE_URL}/files/raw?folder={quote(str(product_dir))}&name={quote(filename)}"
+        def _file_url_prefix(product_dir: Path) -> str:
+            # Sert le fichier via l’endpoint existant /files/raw (folder + name) ;
+            # il ne reste qu'à concaténer quote(filename).
+            return f"{BASE_URL}/files/raw?folder={quote(str(product_dir))}&name="
 
         # === [SÉCURITÉ] ===
         # Réutiliser require_api_key si présent, sinon fallback minimal.
@@ -488,7 +539,7 @@ class FlaskBridgeServer:
             """Liste des dossiers (1 dossier = 1 produit)."""
             items = []
             for d in sorted(_product_dirs(), key=lambda p: p.name.lower()):
-                cnt = sum(1 for f in d.iterdir() if f.is_file() and _is_image(f))
+                cnt = len(_image_names(d, PRODUCT_IMAGE_EXTS))
                 items.append({"slug": _slugify(d.name), "name": d.name, "images_count": cnt})
             offset = max(int(request.args.get("offset", 0)), 0)
             limit = int(request.args.get("limit", 25))
@@ -508,10 +559,10 @@ class FlaskBridgeServer:
                 return jsonify({"error": "not_found"}), 404
 
             images = []
-            for f in sorted(target.iterdir(), key=lambda p: p.name.lower()):
-                if f.is_file() and _is_image(f):
-                    url = _file_url_for(target, f.name)
-                    images.append({"name": f.name, "url": url, "preview_url": url})
+            prefix = _file_url_prefix(target)
+            for name in sorted(_image_names(target, PRODUCT_IMAGE_EXTS), key=str.lower):
+                url = prefix + quote(name)
+                images.append({"name": name, "url": url, "preview_url": url})
             return jsonify({"product": target.name, "slug": slug, "images": images})
 
         @app.post("/products/<slug>/descriptions")
@@ -582,6 +633,14 @@ class FlaskBridgeServer:
         folder: str,
         opts: Dict[str, Any],
     ) -> None:
+        # import différé : image_scraper tire selenium, inutile tant
+        # qu'aucun job de scraping n'est lancé
+        from ..image_scraper import (
+            scrape_images,
+            scrape_variants,
+            _release_cached_driver,
+        )
+
         st.status = "running"
         st.started_at = _dt.datetime.utcnow().isoformat() + "Z"
         try:
@@ -593,7 +652,7 @@ class FlaskBridgeServer:
                     keep_driver=True,
                 )
                 st.variants = scrape_variants(driver)
-                driver.quit()
+                _release_cached_driver()
             else:
                 total = scrape_images(url, selector, folder)
             st.progress["found"] = total
@@ -632,9 +691,7 @@ class FlaskBridgeServer:
             dst = src / (target_subdir or "image fait par gpt")
             dst.mkdir(parents=True, exist_ok=True)
 
-            files = [
-                p for p in src.iterdir() if p.suffix.lower() in {".jpg", ".jpeg", ".png", ".webp"}
-            ]
+            files = [src / name for name in _image_names(src)]
             st.progress["found"] = len(files)
             samples: list[str] = []
 
@@ -664,20 +721,36 @@ class FlaskBridgeServer:
                         out = bg.convert("RGB")
                 return out
 
-            for i, f in enumerate(files, 1):
+            def process(f: Path) -> str | None:
+                """Traite une image ; retourne le message d'erreur éventuel."""
                 try:
                     with Image.open(f) as im:
-                        out = apply_ops(im)
-                        out_path = dst / f.name
-                        out.save(out_path)
+                        apply_ops(im).save(dst / f.name)
+                except Exception as e:
+                    return str(e)
+                return None
+
+            def record(f: Path, err: str | None) -> None:
+                # toujours appelé depuis le thread du job : pas de course sur st
+                if err is None:
                     st.progress["downloaded"] += 1
                     if len(samples) < 5:
-                        samples.append(out_path.name)
-                except Exception as e:
+                        samples.append(f.name)
+                else:
                     st.progress["failed"] += 1
-                    st.errors.append({"file": f.name, "error": str(e)})
-                if delay:
+                    st.errors.append({"file": f.name, "error": err})
+
+            if delay:
+                # rate limit : traitement séquentiel espacé
+                for f in files:
+                    record(f, process(f))
                     sleep(delay)
+            else:
+                # Pillow libère le GIL pendant décodage/encodage : on parallélise
+                workers = max(1, min(8, os.cpu_count() or 1, len(files)))
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    for f, err in zip(files, ex.map(process, files)):
+                        record(f, err)
 
             st.sample_images = samples
             st.output_dir = str(dst)
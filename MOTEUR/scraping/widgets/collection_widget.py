@@ -463,7 +463,7 @@ class CollectionWidget(QWidget):
         if not path.lower().endswith(".csv"):
             path += ".csv"
         try:
-            with open(path, "w", encoding="utf-8", newline="") as f:
+            with open(path, "w", encoding="utf-8", newline="", buffering=1 << 18) as f:
                 writer = csv.writer(f)
                 writer.writerow(["url"])
                 for u in self._urls:
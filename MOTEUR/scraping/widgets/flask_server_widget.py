@@ -13,9 +13,10 @@ from PySide6.QtWidgets import (
     QTextEdit,
     QApplication,
 )
-from PySide6.QtCore import Slot
+from PySide6.QtCore import Slot, QTimer
 import json, requests
 import os
+from collections import deque
 from pathlib import Path
 
 try:
@@ -35,8 +36,16 @@ class FlaskServerWidget(QWidget):
 
     def __init__(self) -> None:
         super().__init__()
+        # on_log est appelé depuis les threads Flask : on bufferise et la
+        # console n'est touchée que par le thread GUI (flush toutes les 80 ms)
+        # deque : append (threads Flask) et popleft (GUI) sont atomiques
+        self._log_buffer: deque[str] = deque()
         self.server = FlaskBridgeServer(on_log=self._append)
         self._build_ui()
+        self._log_flusher = QTimer(self)
+        self._log_flusher.setInterval(80)
+        self._log_flusher.timeout.connect(self._flush_logs)
+        self._log_flusher.start()
         self._load_cfg()
         self._last_job_id = ""
 
@@ -141,7 +150,16 @@ class FlaskServerWidget(QWidget):
 
     # ------------------------------------------------------------------
     def _append(self, text: str) -> None:
-        self.console.append(text)
+        self._log_buffer.append(text)
+
+    def _flush_logs(self) -> None:
+        buf = self._log_buffer
+        if not buf:
+            return
+        # on ne retire que les lignes présentes : celles ajoutées pendant
+        # le flush restent dans la deque pour le tour suivant
+        lines = [buf.popleft() for _ in range(len(buf))]
+        self.console.append("\n".join(lines))
 
     def _gen_key(self) -> None:
         self.api_key.setText(secrets.token_urlsafe(24))
@@ -1,4 +1,4 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit, QPushButton
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit, QPushButton
 from PySide6.QtCore import Slot
 
 from .. import history
@@ -9,7 +9,9 @@ class HistoryWidget(QWidget):
 
     def __init__(self) -> None:
         super().__init__()
-        self.text = QTextEdit(readOnly=True)
+        # texte brut : layout par blocs, bien plus léger que QTextEdit sur
+        # un long historique
+        self.text = QPlainTextEdit(readOnly=True)
         self.refresh_btn = QPushButton("Rafraîchir")
         self.refresh_btn.clicked.connect(self.refresh)
 
@@ -22,10 +24,10 @@ class HistoryWidget(QWidget):
     @Slot()
     def refresh(self) -> None:
         entries = history.load_history()
-        lines = []
-        for entry in entries:
-            lines.append(
-                f"{entry.get('date','')} - {entry.get('url','')} ("\
+        self.text.setPlainText(
+            "\n".join(
+                f"{entry.get('date','')} - {entry.get('url','')} ("
                 f"{entry.get('profile','')} - {entry.get('images',0)} images)"
+                for entry in entries
             )
-        self.text.setPlainText("\n".join(lines))
+        )
@@ -13,14 +13,11 @@ from PySide6.QtWidgets import (
     QApplication,
     QMessageBox,
 )
-from PySide6.QtCore import Qt, Slot, QThread, QTimer, QProcess, QProcessEnvironment
+from PySide6.QtCore import Qt, Slot, QThreadPool, QTimer, QProcess, QProcessEnvironment
 from PySide6.QtGui import QClipboard
 from pathlib import Path
 
-try:
-    from localapp.log_safe import open_utf8
-except ImportError:
-    from log_safe import open_utf8
+from ...common.fileio import read_lines_txt
 from .. import profile_manager as pm
 from .. import history
 
@@ -33,7 +30,10 @@ class ImageScraperWidget(QWidget):
 
         self.storage_widget = storage_widget
 
-        self.export_data: list[dict[str, str]] = []
+        # lignes (URL, variante, image) : tuples plutôt que dicts
+        self.export_data: list[tuple[str, str, str]] = []
+        self._worker = None
+        self._running = False
 
         self.file_edit = QLineEdit()
         # ✅ Alias de compatibilité pour l'ancien code
@@ -176,14 +176,17 @@ class ImageScraperWidget(QWidget):
         if not path:
             return
 
+        header = ["URL", "Variante", "Image"]
+        rows = self.export_data
         try:
             from openpyxl import Workbook
 
-            wb = Workbook()
-            ws = wb.active
-            ws.append(["URL", "Variante", "Image"])
-            for row in self.export_data:
-                ws.append([row["URL"], row["Variant"], row["Image"]])
+            # write_only : les lignes sont sérialisées au fil de l'eau
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.append(header)
+            for row in rows:
+                ws.append(row)
             wb.save(path)
         except Exception as exc:
             QMessageBox.critical(self, "Export", f"Erreur: {exc}")
@@ -206,8 +209,7 @@ class ImageScraperWidget(QWidget):
             return
 
         history.save_last_file(file_path)
-        with open_utf8(path) as f:
-            urls = [line.strip() for line in f if line.strip()]
+        urls = read_lines_txt(path)
         if not urls:
             self.console.append("❌ Aucun URL dans le fichier")
             return
@@ -225,33 +227,41 @@ class ImageScraperWidget(QWidget):
             self._start_scrape_qprocess(args)
             return
 
-        # thread + worker
-        from .image_worker import ImageJobWorker
-        self._thread = QThread(self)
-        self._worker = ImageJobWorker(urls, selector, folder, self.variants_checkbox.isChecked())
-        self._worker.moveToThread(self._thread)
-
-        # connexions
-        self._thread.started.connect(self._worker.run)
-        self._worker.log.connect(lambda s: self._log_buffer.append(s))
-        def _on_item_done(url, total, variants):
-            self.console.append(f"✅ {url} - {total} images")
-            for name, img in (variants or {}).items():
-                self.console.append(f"  • {name}: {img}")
-                self.export_data.append({"URL": url, "Variant": name, "Image": img})
-            # Optionnel: push vers storage_widget
-            if self.storage_widget and variants:
-                self.storage_widget.add_product("", list(variants.keys()))
-        self._worker.item_done.connect(_on_item_done)
-        self._worker.progress.connect(self._on_progress)
-        def _on_finished():
-            self.progress_bar.hide()
-            self.start_btn.setEnabled(True)
-            self._thread.quit(); self._thread.wait()
-            self._worker.deleteLater(); self._thread.deleteLater()
-        self._worker.finished.connect(_on_finished)
-
-        self._thread.start()
+        # worker réutilisable, exécuté dans le pool de threads global
+        if self._worker is None:
+            from .image_worker import ImageJobWorker
+            self._worker = ImageJobWorker()
+            self._worker.log.connect(self._on_worker_log)
+            self._worker.item_done.connect(self._on_item_done)
+            self._worker.progress.connect(self._on_progress)
+            self._worker.finished.connect(self._on_worker_finished)
+        self._worker.reset(urls, selector, folder, self.variants_checkbox.isChecked())
+        self._running = True
+        QThreadPool.globalInstance().start(self._worker)
+
+    def is_running(self) -> bool:
+        """Indique si un job de scraping (thread) est en cours."""
+        return self._running
+
+    @Slot(str)
+    def _on_worker_log(self, text: str) -> None:
+        self._log_buffer.append(text)
+
+    @Slot(str, int, dict)
+    def _on_item_done(self, url: str, total: int, variants: dict) -> None:
+        self.console.append(f"✅ {url} - {total} images")
+        for name, img in (variants or {}).items():
+            self.console.append(f"  • {name}: {img}")
+            self.export_data.append((url, name, img))
+        # Optionnel: push vers storage_widget
+        if self.storage_widget and variants:
+            self.storage_widget.add_product("", list(variants.keys()))
+
+    @Slot()
+    def _on_worker_finished(self) -> None:
+        self._running = False
+        self.progress_bar.hide()
+        self.start_btn.setEnabled(True)
 
     def _start_scrape_qprocess(self, args: list[str]) -> None:
         import sys, json
@@ -290,7 +300,7 @@ class ImageScraperWidget(QWidget):
                 variants = evt.get("variants") or {}
                 for name, img in variants.items():
                     self._log_buffer.append(f"  • {name}: {img}")
-                    self.export_data.append({"URL": url, "Variant": name, "Image": img})
+                    self.export_data.append((url, name, img))
                 if self.storage_widget and variants:
                     self.storage_widget.add_product("", list(variants.keys()))
             elif evt.get("event") == "done":
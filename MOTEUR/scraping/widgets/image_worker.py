@@ -1,8 +1,13 @@
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, Signal
 import sys
 from selenium.webdriver.common.by import By
 from pathlib import Path
-from ..image_scraper import scrape_images, scrape_variants
+from ..image_scraper import (
+    scrape_images,
+    scrape_variants,
+    _make_http_session,
+    _release_cached_driver,
+)
 from .. import history
 
 
@@ -15,15 +20,26 @@ class _SignalStream(QObject):
     def flush(self): pass
 
 
-class ImageJobWorker(QObject):
+class ImageJobWorker(QObject, QRunnable):
+    """Job de scraping exécuté dans le QThreadPool.
+
+    L'instance n'est pas auto-détruite : le widget la garde et la relance
+    avec :meth:`reset` au lieu de recréer un thread à chaque clic.
+    """
+
     log = Signal(str)
     progress = Signal(int, int)        # done, total_urls
     item_done = Signal(str, int, dict) # url, total_images, variants
     finished = Signal()
 
-    def __init__(self, urls, selector, folder, with_variants: bool):
-        super().__init__()
-        self.urls = urls
+    def __init__(self, urls=(), selector="", folder="images", with_variants: bool = False):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self.reset(urls, selector, folder, with_variants)
+
+    def reset(self, urls, selector, folder, with_variants: bool) -> None:
+        self.urls = list(urls)
         self.selector = selector
         self.folder = folder or "images"
         self.with_variants = with_variants
@@ -34,20 +50,23 @@ class ImageJobWorker(QObject):
         stream.text.connect(self.log.emit)
         old_stdout = sys.stdout
         sys.stdout = stream
+        # une session HTTP pour tout le job : TCP/TLS réutilisés d'une URL à l'autre
+        session = _make_http_session()
         try:
             tot = len(self.urls)
             for i, url in enumerate(self.urls, 1):
                 try:
                     if self.with_variants:
-                        total, driver = scrape_images(url, self.selector, self.folder, keep_driver=True)
+                        total, driver = scrape_images(
+                            url, self.selector, self.folder, keep_driver=True, session=session
+                        )
                         try:
                             _ = driver.find_element(By.TAG_NAME, "h1")  # warmup
                         except Exception:
                             pass
                         variants = scrape_variants(driver)
-                        driver.quit()
                     else:
-                        total = scrape_images(url, self.selector, self.folder)
+                        total = scrape_images(url, self.selector, self.folder, session=session)
                         variants = {}
                     history.log_scrape(url, self.selector, total, self.folder)
                     self.item_done.emit(url, total, variants)
@@ -56,4 +75,8 @@ class ImageJobWorker(QObject):
                 self.progress.emit(i, tot)
         finally:
             sys.stdout = old_stdout
+            session.close()
+            if self.with_variants:
+                # driver partagé entre les URLs du job, fermé une seule fois
+                _release_cached_driver()
             self.finished.emit()
@@ -1,3 +1,5 @@
+import os
+
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -7,7 +9,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QLabel,
 )
-from PySide6.QtCore import Signal, Slot, QTimer
+from PySide6.QtCore import Signal, Slot, QFileSystemWatcher
 
 from .. import profile_manager as pm
 from ..bus.event_bus import bus
@@ -27,9 +29,7 @@ class ProfileWidget(QWidget):
 
         self.name_edit = QLineEdit()
         self.selector_edit = QLineEdit()
-        self.selector_edit.setText(
-            ".woocommerce-product-gallery__image a"
-        )
+        self.selector_edit.setText(pm.DEFAULT_SELECTOR)
 
         self.add_btn = QPushButton("Ajouter")
         self.add_btn.clicked.connect(self._add_profile)
@@ -55,21 +55,25 @@ class ProfileWidget(QWidget):
         layout.addLayout(form_layout)
         layout.addLayout(btn_layout)
 
+        self._mtime = 0
         self._load_profiles()
 
         # watch for external profile changes
         bus.profiles_changed.connect(self._load_profiles)
 
-        self._mtime = pm.PROFILES_FILE.stat().st_mtime if pm.PROFILES_FILE.exists() else 0
-        self._timer = QTimer(self)
-        self._timer.setInterval(2500)
-        self._timer.timeout.connect(self._check_profiles_file)
-        self._timer.start()
+        # notifié par l'OS uniquement quand le fichier (ou son dossier) change ;
+        # le dossier est surveillé aussi pour les remplacements atomiques
+        # et la création du fichier.
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._check_profiles_file)
+        self._watcher.directoryChanged.connect(self._check_profiles_file)
+        self._watch_profiles_file()
 
     # ------------------------------------------------------------------
     def _load_profiles(self) -> None:
         """Load profiles from :mod:`profile_manager` and populate the list."""
         self.profiles = pm.load_profiles()
+        self._mtime = self._profiles_mtime()
         self._refresh_list()
 
     def _refresh_list(self) -> None:
@@ -90,8 +94,8 @@ class ProfileWidget(QWidget):
     @Slot()
     def _add_profile(self) -> None:
         name = self.name_edit.text().strip()
-        selector = self.selector_edit.text().strip()
-        if not name or not selector:
+        selector = pm.coalesce_selector(self.selector_edit.text())
+        if not name:
             return
         try:
             pm.add_profile(name, selector)
@@ -103,8 +107,8 @@ class ProfileWidget(QWidget):
     @Slot()
     def _update_profile(self) -> None:
         name = self.name_edit.text().strip()
-        selector = self.selector_edit.text().strip()
-        if not name or not selector:
+        selector = pm.coalesce_selector(self.selector_edit.text())
+        if not name:
             return
         if pm.update_profile(name, selector):
             self._load_profiles()
@@ -120,13 +124,24 @@ class ProfileWidget(QWidget):
             self.profiles_updated.emit()
 
     # ------------------------------------------------------------------
-    def _check_profiles_file(self) -> None:
-        p = pm.PROFILES_FILE
+    @staticmethod
+    def _profiles_mtime() -> float:
         try:
-            m = p.stat().st_mtime
-            if m != self._mtime:
-                self._mtime = m
-                self._load_profiles()
-        except Exception:
-            pass
+            return os.stat(pm.PROFILES_FILE).st_mtime
+        except OSError:
+            return 0
 
+    def _watch_profiles_file(self) -> None:
+        p = pm.PROFILES_FILE
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        for path in (str(p.parent), str(p)):
+            if path not in watched and os.path.exists(path):
+                self._watcher.addPath(path)
+
+    @Slot(str)
+    def _check_profiles_file(self, _path: str = "") -> None:
+        # un remplacement atomique retire le fichier de la surveillance
+        self._watch_profiles_file()
+        m = self._profiles_mtime()
+        if m != self._mtime:
+            self._load_profiles()
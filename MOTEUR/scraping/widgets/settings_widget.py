@@ -140,9 +140,10 @@ class ScrapingSettingsWidget(QWidget):
         max_size = 800_000  # ignore fichiers texte > 800 KB
 
         try:
-            with open_utf8(out, "w") as w:   # <= ÉCRASE à chaque clic
+            # <= ÉCRASE à chaque clic ; tampon 256 Ko (beaucoup de petites écritures)
+            with open_utf8(out, "w", buffering=1 << 18) as w:
                 for dirpath, dirnames, filenames in os.walk(root):
-                    dn = os.path.basename(dirpath)
+                    dn = dirpath.rpartition(os.sep)[2]
                     if dn in ignore_dirs:
                         continue
                     for fn in sorted(filenames):
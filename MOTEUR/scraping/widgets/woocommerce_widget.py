@@ -30,6 +30,13 @@ try:
 except Exception:
     IMAGES_JOINER = os.getenv("IMAGES_JOINER", ";")
 
+# Extensions d'images locales, par ordre de préférence.
+_IMAGE_EXTS = (".webp", ".jpg", ".jpeg", ".png")
+_IMAGE_EXT_SET = frozenset(_IMAGE_EXTS)
+
+_SLUG_STRIP_RE = re.compile(r"[^a-zA-Z0-9\s-]")
+_SLUG_SEP_RE = re.compile(r"[\s_-]+")
+
 
 class WooCommerceProductWidget(QWidget):
     """Widget to edit WooCommerce product data in a table."""
@@ -66,8 +73,8 @@ class WooCommerceProductWidget(QWidget):
     def _slugify(text: str) -> str:
         text = unicodedata.normalize("NFKD", text)
         text = text.encode("ascii", "ignore").decode("ascii")
-        text = re.sub(r"[^a-zA-Z0-9\s-]", "", text)
-        text = re.sub(r"[\s_-]+", "-", text).strip("-")
+        text = _SLUG_STRIP_RE.sub("", text)
+        text = _SLUG_SEP_RE.sub("-", text).strip("-")
         return text.lower()
 
     def _uploads_base(self) -> str:
@@ -82,21 +89,28 @@ class WooCommerceProductWidget(QWidget):
             sub = (raw + "/") if raw else ""
         return urljoin(site + "/", f"wp-content/uploads/{sub}")
 
-    def _clean_image_urls(self, urls: list[str]) -> list[str]:
-        """Remove duplicate image URLs using exact and prefix based checks."""
-        unique_urls: list[str] = []
-        for url in urls:
-            if url not in unique_urls:
-                unique_urls.append(url)
+    def _dedup_pattern(self) -> re.Pattern[str]:
+        return re.compile(self.dedup_regex_edit.text().strip() or r"(_\d+)$")
+
+    def _clean_image_urls(
+        self, urls: list[str], pattern: re.Pattern[str] | None = None
+    ) -> list[str]:
+        """Remove duplicate image URLs using exact and prefix based checks.
 
-        pattern = re.compile(self.dedup_regex_edit.text().strip() or r"(_\d+)$")
+        ``pattern`` lets batch callers compile the dedup regex only once.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+
+        if pattern is None:
+            pattern = self._dedup_pattern()
         prefix_set: set[str] = set()
         final_images: list[str] = []
 
         for url in unique_urls:
-            filename = url.split("/")[-1]
-            base = filename.rsplit(".", 1)[0]
-            prefix = pattern.sub("", base).split("_")[0]
+            filename = url.rpartition("/")[2]
+            stem, dot, _ = filename.rpartition(".")
+            base = stem if dot else filename
+            prefix = pattern.sub("", base).partition("_")[0]
 
             if prefix not in prefix_set:
                 final_images.append(url)
@@ -222,7 +236,7 @@ class WooCommerceProductWidget(QWidget):
             return
         if not path.lower().endswith(".csv"):
             path += ".csv"
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 18) as f:
             writer = csv.writer(f, delimiter=";")
             writer.writerow(self.HEADERS)
             for row in range(self.table.rowCount()):
@@ -250,24 +264,27 @@ class WooCommerceProductWidget(QWidget):
             urls.extend(u.strip() for u in item.text().split(IMAGES_JOINER) if u.strip())
 
         results: list[tuple[str, str]] = []
-        for url in urls:
-            ok = False
-            try:
-                resp = requests.head(url, timeout=5, allow_redirects=True)
-                ok = 200 <= resp.status_code < 400
-                if not ok:
-                    resp = requests.get(
-                        url,
-                        timeout=5,
-                        stream=True,
-                        headers={"Range": "bytes=0-0"},
-                    )
-                    ok = 200 <= resp.status_code < 400
-            except Exception:
+        # une seule session : connexions TCP/TLS réutilisées entre les URLs
+        # (en général toutes sur le même domaine)
+        with requests.Session() as session:
+            for url in urls:
                 ok = False
-            results.append((url, "oui" if ok else "non"))
+                try:
+                    resp = session.head(url, timeout=5, allow_redirects=True)
+                    ok = 200 <= resp.status_code < 400
+                    if not ok:
+                        resp = session.get(
+                            url,
+                            timeout=5,
+                            stream=True,
+                            headers={"Range": "bytes=0-0"},
+                        )
+                        ok = 200 <= resp.status_code < 400
+                except Exception:
+                    ok = False
+                results.append((url, "oui" if ok else "non"))
 
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 18) as f:
             writer = csv.writer(f, delimiter=";")
             writer.writerow(["URL", "OK"])
             writer.writerows(results)
@@ -317,34 +334,41 @@ class WooCommerceProductWidget(QWidget):
                     used_skus.add(sku)
                     return sku
 
+        # invariants de la boucle produits, lus une seule fois
         base = self._uploads_base()
+        clean_images = self.clean_images_checkbox.isChecked()
+        dedup_re = self._dedup_pattern() if clean_images else None
+        slugify = self._slugify
+
+        def _pick_variant_file(stem: str, local_set: set[str]) -> str:
+            for ext in _IMAGE_EXTS:
+                candidate = stem + ext
+                if candidate in local_set:
+                    return candidate
+            return stem + ".webp"
 
         for prod in products:
             product_name = prod["name"]
             variants = prod["variants"]
-            product_slug = self._slugify(product_name)
+            product_slug = slugify(product_name)
             folder = self.IMAGES_ROOT / product_name
             local_images: list[str] = []
             if folder.is_dir():
-                for p in sorted(folder.iterdir()):
-                    if p.suffix.lower() in {".webp", ".jpg", ".jpeg", ".png"}:
-                        local_images.append(p.name)
+                for name in sorted(p.name for p in folder.iterdir()):
+                    dot = name.rfind(".")
+                    if dot != -1 and name[dot:].lower() in _IMAGE_EXT_SET:
+                        local_images.append(name)
+            local_set = set(local_images)
 
             display_name = product_name or product_slug.replace("-", " ").strip()
 
-            def _pick_variant_file(var_name: str, *, local_images: list[str], product_slug: str) -> str:
-                var_slug = self._slugify(var_name)
-                for ext in (".webp", ".jpg", ".jpeg", ".png"):
-                    candidate = f"{product_slug}-{var_slug}{ext}"
-                    if candidate in local_images:
-                        return candidate
-                return f"{product_slug}-{var_slug}.webp"
-
+            variant_slugs = [slugify(v) for v in variants]
             variant_files = [
-                _pick_variant_file(v, local_images=local_images, product_slug=product_slug)
-                for v in variants
+                _pick_variant_file(f"{product_slug}-{vs}", local_set)
+                for vs in variant_slugs
             ]
-            generic_images = [img for img in local_images if img not in variant_files]
+            variant_set = set(variant_files)
+            generic_images = [img for img in local_images if img not in variant_set]
 
             is_variable = len(variants) > 1
 
@@ -379,8 +403,8 @@ class WooCommerceProductWidget(QWidget):
 
                 urls: list[str] = []
                 generic_name = None
-                for ext in (".webp", ".jpg", ".jpeg", ".png"):
-                    candidate = f"{product_slug}{ext}"
+                for ext in _IMAGE_EXTS:
+                    candidate = product_slug + ext
                     if candidate in generic_images:
                         generic_name = candidate
                         break
@@ -394,8 +418,8 @@ class WooCommerceProductWidget(QWidget):
                     if u not in seen:
                         urls_dedup.append(u)
                         seen.add(u)
-                if self.clean_images_checkbox.isChecked():
-                    urls_dedup = self._clean_image_urls(urls_dedup)
+                if clean_images:
+                    urls_dedup = self._clean_image_urls(urls_dedup, dedup_re)
                 if urls_dedup:
                     parent_images_cell = IMAGES_JOINER.join(urls_dedup)
                     self.table.setItem(row, img_col, QTableWidgetItem(parent_images_cell))
@@ -403,13 +427,12 @@ class WooCommerceProductWidget(QWidget):
                 current_row = row
                 parent_regular_item = self.table.item(row, regular_price_col)
                 parent_regular = parent_regular_item.text() if parent_regular_item else ""
-                for variant in variants:
+                for variant, var_slug, file_name in zip(variants, variant_slugs, variant_files):
                     current_row += 1
                     self.table.insertRow(current_row)
                     for c in range(self.table.columnCount()):
                         self.table.setItem(current_row, c, QTableWidgetItem(""))
                     self.table.setItem(current_row, type_col, QTableWidgetItem("variation"))
-                    var_slug = self._slugify(variant)
                     sku_var = f"{parent_sku}-{var_slug}"
                     used_skus.add(sku_var)
                     name_var = f"{display_name} {variant}".strip()
@@ -423,9 +446,6 @@ class WooCommerceProductWidget(QWidget):
                     self.table.setItem(current_row, attr_value_col, QTableWidgetItem(variant))
                     self.table.setItem(current_row, attr_visible_col, QTableWidgetItem("1"))
                     self.table.setItem(current_row, attr_global_col, QTableWidgetItem("1"))
-                    file_name = _pick_variant_file(
-                        variant, local_images=local_images, product_slug=product_slug
-                    )
                     self.table.setItem(
                         current_row, img_col, QTableWidgetItem(base + file_name)
                     )
@@ -451,8 +471,8 @@ class WooCommerceProductWidget(QWidget):
                 self.table.setItem(row, stock_col, QTableWidgetItem("999"))
                 self.table.setItem(row, tax_status_col, QTableWidgetItem("taxable"))
                 images = [base + img for img in generic_images + variant_files]
-                if self.clean_images_checkbox.isChecked():
-                    images = self._clean_image_urls(images)
+                if clean_images:
+                    images = self._clean_image_urls(images, dedup_re)
                 if images:
                     self.table.setItem(
                         row,
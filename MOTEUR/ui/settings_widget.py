@@ -37,8 +37,9 @@ class SettingsWidget(QWidget):
         self.dark_radio = QRadioButton("Sombre")
         current = load_theme()
         (self.dark_radio if current == "dark" else self.light_radio).setChecked(True)
-        self.light_radio.toggled.connect(lambda _: self._apply())
-        self.dark_radio.toggled.connect(lambda _: self._apply())
+        # un clic bascule les deux radios : seul le bouton coché applique
+        self.light_radio.toggled.connect(self._on_radio_toggled)
+        self.dark_radio.toggled.connect(self._on_radio_toggled)
         radios.addWidget(self.light_radio)
         radios.addWidget(self.dark_radio)
         t_layout.addLayout(radios)
@@ -48,6 +49,11 @@ class SettingsWidget(QWidget):
         layout.addWidget(theme_group)
         layout.addWidget(QLabel("Appliqué à toute l’application. Persistant dans settings.json"))
 
+    @Slot(bool)
+    def _on_radio_toggled(self, checked: bool) -> None:
+        if checked:
+            self._apply()
+
     @Slot()
     def _apply(self) -> None:
         name = "dark" if self.dark_radio.isChecked() else "light"
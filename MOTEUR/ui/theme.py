@@ -6,6 +6,8 @@ import json
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QPalette, QColor
 
+from ..common.fileio import write_json_atomic
+
 
 THEME_FILE = Path(__file__).resolve().parents[2] / "settings.json"
 
@@ -25,10 +27,7 @@ def load_theme() -> str:
 def save_theme(name: str) -> None:
     """Persist the theme name into :data:`THEME_FILE`."""
     name = "dark" if name.lower() == "dark" else "light"
-    THEME_FILE.write_text(
-        json.dumps({"theme": name}, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    write_json_atomic(THEME_FILE, {"theme": name})
 
 
 def _dark_palette() -> QPalette:
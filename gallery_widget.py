@@ -1,15 +1,142 @@
+import atexit
+import itertools
 import traceback
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List
 from urllib.parse import quote
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QDesktopServices
+from PySide6.QtCore import (
+    QCoreApplication, Qt, QSize, QUrl, QRect, QTimer, QBuffer, QByteArray, QIODevice,
+    QObject, QRunnable, QThreadPool, Signal, Slot,
+)
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache, QImageReader, QDesktopServices
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QSpinBox,
     QLabel, QScrollArea, QGridLayout, QDialog
 )
 from ui_helpers import show_toast, busy_dialog
 
+try:  # parsing JSON plus rapide si disponible
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    import json
+
+    _json_loads = json.loads
+
+# Taille du cache de vignettes partagé (Ko) : ~64 Mo
+THUMB_CACHE_KB = 65536
+THUMB_W, THUMB_H = 180, 140
+# Cartes insérées par tour de boucle d'événements
+INSERT_CHUNK = 10
+
+
+# Ressources réseau partagées par toutes les galeries du processus
+_SESSION: requests.Session | None = None
+_NAM: QNetworkAccessManager | None = None
+
+
+def _shared_session() -> requests.Session:
+    """Session HTTP unique (keep-alive, pool de connexions)."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        _SESSION.mount("http://", adapter)
+        _SESSION.mount("https://", adapter)
+        atexit.register(_SESSION.close)
+    return _SESSION
+
+
+def _shared_nam() -> QNetworkAccessManager:
+    """QNetworkAccessManager unique, rattaché à l'application Qt courante."""
+    global _NAM
+    app = QCoreApplication.instance()
+    try:
+        if _NAM is not None and _NAM.parent() is app:
+            return _NAM
+    except RuntimeError:
+        pass  # application précédente détruite avec son NAM
+    _NAM = QNetworkAccessManager(app)
+    return _NAM
+
+
+def _thumb_url(url: str) -> str:
+    """Demande au serveur une vignette déjà réduite (ignoré s'il ne sait pas)."""
+    sep = "&" if "?" in url else "?"
+    return f"{url}{sep}w={THUMB_W}&h={THUMB_H}"
+
+
+# Sous-types MIME -> format Qt (évite la détection par lecture d'en-tête)
+_QT_IMAGE_FORMATS = {
+    "jpeg": b"jpeg", "jpg": b"jpeg", "pjpeg": b"jpeg",
+    "png": b"png", "webp": b"webp", "gif": b"gif", "bmp": b"bmp",
+}
+
+
+def _image_format(content_type: str | None) -> bytes | None:
+    """Format Qt déduit de ``Content-Type`` ; ``b""`` si ce n'est pas une image.
+
+    ``None`` quand l'en-tête est absent ou le sous-type inconnu : on laisse
+    alors Qt deviner à partir du contenu.
+    """
+    if not content_type:
+        return None
+    mime = content_type.partition(";")[0].strip().lower()
+    major, _, sub = mime.partition("/")
+    if major != "image":
+        return b""
+    return _QT_IMAGE_FORMATS.get(sub)
+
+
+def _decode_thumb(data: QByteArray, box: QSize, fmt: bytes | None = None) -> QImage:
+    """Décode ``data`` directement à la taille de ``box`` (ratio conservé).
+
+    ``QImageReader.setScaledSize`` laisse le décodeur (JPEG notamment) réduire
+    pendant la lecture, sans passer par l'image pleine résolution.
+    """
+    buf = QBuffer(data)
+    buf.open(QIODevice.ReadOnly)
+    reader = QImageReader(buf)
+    if fmt:
+        reader.setFormat(fmt)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid() and (size.width() > box.width() or size.height() > box.height()):
+        reader.setScaledSize(size.scaled(box, Qt.KeepAspectRatio))
+    img = reader.read()
+    buf.close()
+    if img.isNull() and fmt:
+        # Content-Type erroné côté serveur : nouvel essai avec détection
+        return _decode_thumb(data, box)
+    if not img.isNull() and (img.width() > box.width() or img.height() > box.height()):
+        # Format sans taille connue à l'avance : réduction rapide après coup
+        img = img.scaled(box, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return img
+
+
+class _DecodeSignals(QObject):
+    done = Signal(object, str, QImage)  # QLabel cible, URL, image décodée
+
+
+class _DecodeJob(QRunnable):
+    """Décode une vignette hors du thread GUI (QImage est utilisable partout)."""
+
+    def __init__(self, data: QByteArray, box: QSize, fmt, lbl_img, url: str, signals):
+        super().__init__()
+        self.data = data
+        self.box = box
+        self.fmt = fmt
+        self.lbl_img = lbl_img
+        self.url = url
+        self.signals = signals
+
+    def run(self):
+        img = _decode_thumb(self.data, self.box, self.fmt)
+        self.signals.done.emit(self.lbl_img, self.url, img)
+
 
 class ImagePreviewDialog(QDialog):
     def __init__(self, parent=None, title="Aperçu", pixmap: QPixmap = None):
@@ -24,12 +151,79 @@ class ImagePreviewDialog(QDialog):
         self.resize(900, 700)
 
 
+class ThumbCard(QWidget):
+    """Carte de vignette : l'image n'est demandée qu'une fois visible.
+
+    Toutes les cartes ont la même taille fixe (calculée une seule fois) :
+    la grille n'a plus à négocier les ``sizeHint`` carte par carte.
+    """
+
+    _fixed_size: QSize | None = None
+
+    def __init__(self, parent, name: str, url: str):
+        super().__init__(parent)
+        self.name = name
+        self.url = url
+        self.loaded = False
+        v = QVBoxLayout(self)
+        self.lbl_img = QLabel(self)
+        self.lbl_img.setAlignment(Qt.AlignCenter)
+        self.lbl_img.setFixedSize(QSize(THUMB_W, THUMB_H))
+        self.lbl_img.setText("Chargement…")
+        self.lbl_name = QLabel(self)
+        self.lbl_name.setFixedWidth(THUMB_W)
+        self.btn_view = QPushButton("Aperçu", self)
+        v.addWidget(self.lbl_img)
+        v.addWidget(self.lbl_name)
+        v.addWidget(self.btn_view)
+        self.set_name(name)
+        if ThumbCard._fixed_size is None:
+            ThumbCard._fixed_size = self.sizeHint()
+        self.setFixedSize(ThumbCard._fixed_size)
+
+    def reset(self, name: str, url: str):
+        """Réutilise la carte pour un autre fichier (pool de cartes)."""
+        self.name = name
+        self.url = url
+        self.loaded = False
+        self.lbl_img.setProperty("thumb_url", "")
+        self.lbl_img.clear()
+        self.lbl_img.setText("Chargement…")
+        self.set_name(name)
+
+    def set_name(self, name: str):
+        # Nom tronqué : un nom long ne doit pas élargir la colonne
+        fm = self.lbl_name.fontMetrics()
+        self.lbl_name.setText(fm.elidedText(name, Qt.ElideMiddle, THUMB_W))
+        self.lbl_name.setToolTip(name)
+
+    def start_load(self, loader):
+        if self.loaded:
+            return
+        self.loaded = True
+        loader(self.url, self.lbl_img)
+
+
 class GalleryWidget(QWidget):
     def __init__(self, parent=None, base_url: str = "", api_key: str | None = None):
         super().__init__(parent)
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self._files: List[str] = []
+        if QPixmapCache.cacheLimit() < THUMB_CACHE_KB:
+            QPixmapCache.setCacheLimit(THUMB_CACHE_KB)
+        # Téléchargements des vignettes asynchrones (hors thread UI)
+        self._nam = _shared_nam()
+        self._pending: set[QNetworkReply] = set()
+        # Cartes retirées de la grille, réutilisées au rendu suivant
+        self._card_pool: list[ThumbCard] = []
+        self._decode_signals = _DecodeSignals(self)
+        self._decode_signals.done.connect(self._on_thumb_decoded)
+        self._last_sig: tuple | None = None
+        self._items: list[dict] = []
+        # Session HTTP partagée (keep-alive) pour l'API et les aperçus ;
+        # la clé API est propre à chaque galerie, donc passée par requête.
+        self._session = _shared_session()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -60,6 +254,27 @@ class GalleryWidget(QWidget):
         self.scroll.setWidget(self.grid_host)
         main.addWidget(self.scroll)
 
+        # Chargement des vignettes visibles uniquement (debounce du défilement)
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(50)
+        self._visible_timer.timeout.connect(self._load_visible)
+        self.scroll.verticalScrollBar().valueChanged.connect(self._schedule_load_visible)
+
+        # Nombre de colonnes recalculé en fin de redimensionnement seulement
+        self._col_count = 5
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self._relayout_grid)
+
+        # Insertion progressive des cartes : la fenêtre reste réactive
+        self._insert_iter = None
+        self._insert_pos = 0
+        self._insert_timer = QTimer(self)
+        self._insert_timer.setInterval(0)
+        self._insert_timer.timeout.connect(self._insert_chunk)
+
         self.status_lbl = QLabel("Aucune liste chargée.", self)
         main.addWidget(self.status_lbl)
 
@@ -76,7 +291,9 @@ class GalleryWidget(QWidget):
     def _api_get(self, path, params=None):
         url = f"{self.base_url}{path}"
         try:
-            r = requests.get(url, params=params or {}, headers=self._headers(), timeout=20)
+            r = self._session.get(
+                url, params=params or {}, headers=self._headers(), timeout=20
+            )
             if r.status_code == 401:
                 show_toast(self, "Clé API absente ou invalide (401).", error=True)
                 return None
@@ -88,6 +305,19 @@ class GalleryWidget(QWidget):
             show_toast(self, f"Erreur de requête: {ex}", error=True)
         return None
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_load_visible()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._resize_timer.start()
+        self._schedule_load_visible()
+
+    def closeEvent(self, event):
+        self._abort_pending()
+        super().closeEvent(event)
+
     # --- Actions ---
     def on_open_dir_clicked(self):
         show_toast(self, "Ouverture dossier côté OS non disponible.", error=True)
@@ -106,39 +336,118 @@ class GalleryWidget(QWidget):
         if r is None:
             return
         r.raise_for_status()
-        data = r.json()
+        data = _json_loads(r.content)
 
         self._raw_folder = data.get("folder", target)
         files = data.get("files", [])
         urls = data.get("urls", [])
 
-        # Mémoriser la liste structurée pour l'UI
-        self._items = []
-        for name, url in zip(files, urls):
-            self._items.append({"name": name, "url": url})
-
-        self._items = self._items[: self.limit_spin.value()]
-        self._render_thumbs(self._items)
+        limit = self.limit_spin.value()
+        # Même dossier, mêmes fichiers, même limite : la grille est déjà à jour
+        sig = (target, tuple(files), tuple(urls), limit)
+        if sig != self._last_sig:
+            self._last_sig = sig
+            # Mémoriser la liste structurée pour l'UI
+            self._items = [
+                {"name": name, "url": url} for name, url in zip(files, urls)
+            ][:limit]
+            self._render_thumbs(self._items)
         self.status_lbl.setText(
             f"{len(self._items)} fichiers affichés (sur {len(files)})."
         )
         self.open_dir_btn.setEnabled(True)
 
+    def _abort_pending(self):
+        # Vidé avant abort() : _apply_thumb reconnaît ainsi nos annulations
+        pending, self._pending = self._pending, set()
+        for reply in pending:
+            reply.abort()
+
     def _render_thumbs(self, items):
-        while self.grid.count():
-            w = self.grid.takeAt(0).widget()
-            if w:
-                w.deleteLater()
-
-        col_count = 5
-        row = col = 0
-        for item in items:
-            card = self._make_thumb_card(item)
-            self.grid.addWidget(card, row, col)
-            col += 1
-            if col >= col_count:
-                col = 0
-                row += 1
+        self._abort_pending()
+        # Une seule passe de layout/peinture pour vider la grille
+        self.grid_host.setUpdatesEnabled(False)
+        try:
+            while self.grid.count():
+                w = self.grid.takeAt(0).widget()
+                if isinstance(w, ThumbCard):
+                    w.hide()
+                    self._card_pool.append(w)
+                elif w:
+                    w.deleteLater()
+        finally:
+            self.grid_host.setUpdatesEnabled(True)
+        self._col_count = self._fit_columns()
+        # Un nouvel appel remplace l'itérateur : la série précédente s'arrête
+        self._insert_iter = iter(items)
+        self._insert_pos = 0
+        self._insert_chunk()
+        if self._insert_iter is not None:
+            self._insert_timer.start()
+
+    def _insert_chunk(self):
+        if self._insert_iter is None:
+            self._insert_timer.stop()
+            return
+        chunk = list(itertools.islice(self._insert_iter, INSERT_CHUNK))
+        if chunk:
+            col_count = self._col_count
+            self.grid_host.setUpdatesEnabled(False)
+            try:
+                for item in chunk:
+                    card = self._make_thumb_card(item)
+                    pos = self._insert_pos
+                    self.grid.addWidget(card, pos // col_count, pos % col_count)
+                    self._insert_pos = pos + 1
+            finally:
+                self.grid_host.setUpdatesEnabled(True)
+                self.grid_host.updateGeometry()
+            self._schedule_load_visible()
+        if len(chunk) < INSERT_CHUNK:
+            self._insert_iter = None
+            self._insert_timer.stop()
+
+    def _fit_columns(self) -> int:
+        card = ThumbCard._fixed_size
+        card_w = card.width() if card is not None else THUMB_W + 22
+        spacing = max(self.grid.horizontalSpacing(), 0)
+        avail = self.scroll.viewport().width() - self.grid.contentsMargins().left() * 2
+        return max(1, (avail + spacing) // (card_w + spacing))
+
+    def _relayout_grid(self):
+        col_count = self._fit_columns()
+        if col_count == self._col_count:
+            return
+        self._col_count = col_count
+        # Les cartes existantes sont simplement replacées, pas recréées
+        cards = [self.grid.itemAt(i).widget() for i in range(self.grid.count())]
+        self.grid_host.setUpdatesEnabled(False)
+        try:
+            while self.grid.count():
+                self.grid.takeAt(0)
+            for i, card in enumerate(cards):
+                self.grid.addWidget(card, i // col_count, i % col_count)
+        finally:
+            self.grid_host.setUpdatesEnabled(True)
+        self._schedule_load_visible()
+
+    def _schedule_load_visible(self, *_):
+        self._visible_timer.start()
+
+    def _load_visible(self):
+        if not self.isVisible():
+            return
+        vp = self.scroll.viewport()
+        pos = self.grid_host.pos()
+        # Zone visible en coordonnées de grid_host, avec une rangée d'avance
+        visible = QRect(-pos.x(), -pos.y(), vp.width(), vp.height()).adjusted(
+            0, -140, 0, 140
+        )
+        for i in range(self.grid.count()):
+            card = self.grid.itemAt(i).widget()
+            if isinstance(card, ThumbCard) and not card.loaded:
+                if card.geometry().intersects(visible):
+                    card.start_load(self._load_thumb)
 
     def _make_thumb_card(self, item):
         """
@@ -154,47 +463,92 @@ class GalleryWidget(QWidget):
                 f"&name={quote(name)}"
             )
 
-        w = QWidget(self)
-        v = QVBoxLayout(w)
-        lbl_img = QLabel(w)
-        lbl_img.setAlignment(Qt.AlignCenter)
-        lbl_img.setFixedSize(QSize(180, 140))
-        lbl_img.setText("Chargement…")
+        if self._card_pool:
+            w = self._card_pool.pop()
+            w.reset(name, url)
+            w.show()
+            return w
+        w = ThumbCard(self.grid_host, name, url)
+        # La carte peut être recyclée : on lit nom/URL au moment du clic
+        w.btn_view.clicked.connect(lambda _=False, c=w: self._open_preview(c.name, c.url))
+        return w
+
+    def _load_thumb(self, url: str, lbl_img: QLabel):
+        url = _thumb_url(url)
+        lbl_img.setProperty("thumb_url", url)
+        # Vignette déjà décodée et mise à l'échelle : ni requête ni décodage
+        pm = QPixmapCache.find(url)
+        if pm is not None and not pm.isNull():
+            lbl_img.setPixmap(pm)
+            return
+        req = QNetworkRequest(QUrl(url))
+        if self.api_key:
+            req.setRawHeader(b"X-API-KEY", self.api_key.encode("utf-8"))
+        req.setTransferTimeout(20000)
+        reply = self._nam.get(req)
+        self._pending.add(reply)
+        reply.finished.connect(
+            lambda r=reply, u=url, l=lbl_img: self._apply_thumb(r, u, l)
+        )
 
+    def _apply_thumb(self, reply: QNetworkReply, url: str, lbl_img: QLabel):
+        reply.deleteLater()
+        if reply not in self._pending:
+            return  # annulée : grille reconstruite ou fenêtre fermée
+        self._pending.discard(reply)
         try:
-            rr = requests.get(url, headers=self._headers(), timeout=20)
-            if rr.status_code == 200:
-                pm = QPixmap()
-                pm.loadFromData(rr.content)
-                if not pm.isNull():
-                    pm = pm.scaled(
-                        lbl_img.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                    lbl_img.setPixmap(pm)
-                else:
-                    lbl_img.setText("Non image")
-            else:
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            if reply.error() != QNetworkReply.NoError or status != 200:
+                # échec passager (serveur absent, délai dépassé...) : le
+                # prochain « Lister » reconstruit la grille et réessaie
+                self._last_sig = None
                 lbl_img.setText("Erreur")
-        except Exception:
-            lbl_img.setText("Erreur")
-
-        lbl_name = QLabel(name, w)
-        btn_view = QPushButton("Aperçu", w)
-        btn_view.clicked.connect(lambda: self._open_preview(name, url))
+                return
+            # Corps JSON/HTML renvoyé en 200 : inutile de lancer un décodage
+            fmt = _image_format(reply.header(QNetworkRequest.ContentTypeHeader))
+            if fmt == b"":
+                lbl_img.setText("Non image")
+                return
+            # readAll() rend un QByteArray partagé (pas de bytes Python) que
+            # QBuffer lit sans copie ; le QNetworkReply lui-même ne peut pas
+            # être lu depuis le thread de décodage.
+            job = _DecodeJob(
+                reply.readAll(), lbl_img.size(), fmt, lbl_img, url, self._decode_signals
+            )
+            QThreadPool.globalInstance().start(job)
+        except RuntimeError:
+            pass  # QLabel détruit avant la fin du téléchargement
 
-        v.addWidget(lbl_img)
-        v.addWidget(lbl_name)
-        v.addWidget(btn_view)
-        return w
+    @Slot(object, str, QImage)
+    def _on_thumb_decoded(self, lbl_img: QLabel, url: str, img: QImage):
+        # QPixmap ne peut être créé que dans le thread GUI
+        try:
+            if lbl_img.property("thumb_url") != url:
+                return  # carte recyclée pour un autre fichier entre-temps
+            if img.isNull():
+                lbl_img.setText("Non image")
+                return
+            pm = QPixmap.fromImage(img)
+            QPixmapCache.insert(url, pm)
+            lbl_img.setPixmap(pm)
+        except RuntimeError:
+            pass
 
     def _open_preview(self, name: str, url: str):
         try:
-            rr = requests.get(url, headers=self._headers(), timeout=20)
+            rr = self._session.get(url, headers=self._headers(), timeout=20)
             if rr.status_code != 200:
                 show_toast(self, "Erreur", error=True)
                 return
+            fmt = _image_format(rr.headers.get("Content-Type"))
+            if fmt == b"":
+                show_toast(self, "Fichier non image.", error=True)
+                return
             pm = QPixmap()
-            pm.loadFromData(rr.content)
+            if fmt:
+                pm.loadFromData(rr.content, fmt.decode("ascii"))
+            else:
+                pm.loadFromData(rr.content)
             if pm.isNull():
                 show_toast(self, "Fichier non image.", error=True)
                 return
@@ -18,6 +18,7 @@ try:
 except ImportError:
     from log_safe import print_safe, open_utf8
 
+from functools import lru_cache, partial
 from pathlib import Path
 import sys
 
@@ -26,10 +27,32 @@ import sys
 # interpreter only adds the ``localapp`` directory to ``sys.path`` which
 # prevents imports from the sibling ``MOTEUR`` package.  Adding the parent
 # directory resolves ``ModuleNotFoundError`` for these local imports.
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
+# Imported as ``localapp.app`` (``python -m localapp.app``, tests), the root
+# is already importable and ``sys.path`` is left untouched.  ``__file__`` is
+# already absolute (Python >= 3.9), so no ``resolve()`` / symlink walk here.
+PROJECT_ROOT = Path(__file__).parents[1]
+if not __package__ and str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 SETTINGS_FILE = PROJECT_ROOT / "settings.json"
+# settings.json lu une seule fois par processus
+_SETTINGS_CACHE: dict | None = None
+
+try:  # (dé)sérialisation JSON plus rapide si disponible
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    import json
+
+    _json_loads = json.loads
+
+    def _json_dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 try:
     from PySide6.QtWidgets import (
         QApplication,
@@ -40,28 +63,100 @@ try:
         QPushButton,
         QLabel,
         QSizePolicy,
-        QScrollArea,
         QFrame,
+        QButtonGroup,
+    )
+    from PySide6.QtCore import (
+        Qt,
+        QAbstractAnimation,
+        QVariantAnimation,
+        QEvent,
+        QTimer,
+        Slot,
+        QEasingCurve,
     )
-    from PySide6.QtCore import Qt, QPropertyAnimation, Slot, QEasingCurve
     from PySide6.QtGui import QIcon, QKeySequence, QShortcut
 except ModuleNotFoundError:
     print_safe("Install dependencies with pip install -r requirements.txt")
     sys.exit(1)
 
-from MOTEUR.scraping.widgets.scrap_widget import ScrapWidget
-from MOTEUR.compta.achats.widget import AchatWidget
-from MOTEUR.compta.ventes.widget import VenteWidget
-from MOTEUR.compta.accounting.widget import AccountWidget
-from MOTEUR.scraping.widgets.profile_widget import ProfileWidget
-from MOTEUR.compta.dashboard.widget import DashboardWidget
-from gallery_widget import GalleryWidget
-
+# Les modules des pages (MOTEUR, galerie, paramètres) sont importés dans
+# leurs fabriques : le démarrage ne charge que la barre latérale.
 from localapp.ui_theme import ThemeManager
 from localapp.ui_icons import get_icon
 from localapp.ui_animations import AnimatedStack
-from localapp.pages.settings_page import SettingsPage
-import json
+
+# Politiques de taille résolues une fois (utilisées par chaque bouton)
+_EXPAND = QSizePolicy.Policy.Expanding
+_MIN = QSizePolicy.Policy.Minimum
+_FIXED = QSizePolicy.Policy.Fixed
+
+
+@lru_cache(maxsize=None)
+def _key_sequence(key: str) -> QKeySequence:
+    """Raccourci analysé une seule fois par chaîne (``"Ctrl+1"``...)."""
+    return QKeySequence.fromString(key, QKeySequence.PortableText)
+
+
+# Styles de la barre latérale, analysés une seule fois et posés sur la
+# fenêtre principale (prioritaires sur la QSS du thème, comme auparavant).
+_SIDEBAR_QSS = """
+QWidget#sidebar, QWidget#sidebar QWidget {
+    background-color: #ffffff;
+}
+#sidebar QPushButton[class="sidebar-btn"] {
+    padding: 10px;
+    border: none;
+    background-color: #f0f0f0;
+    color: #333;
+    text-align: left;
+}
+#sidebar QPushButton[class="sidebar-btn"]:hover {
+    background-color: #d0d0d0;
+}
+#sidebar QPushButton[class="sidebar-btn"]:checked {
+    background-color: #c0c0c0;
+    font-weight: bold;
+}
+#sidebar QPushButton[class="collapsible-header"] {
+    background-color: #444;
+    color: white;
+    padding: 10px;
+    text-align: left;
+    font-weight: bold;
+}
+#sidebar QPushButton[class="collapsible-header"]:checked {
+    background-color: #666;
+}
+"""
+
+
+# Entrées de la section Comptabilité : (libellé, icône, méthode MainWindow).
+# ``None`` = simple page texte « Comptabilité : <libellé> ».
+_COMPTA_ITEMS = (
+    ("Tableau de bord", "dashboard", "show_dashboard_page"),
+    ("Journal", "journal", None),
+    ("Grand Livre", "grand_livre", None),
+    ("Bilan", "bilan", None),
+    ("Résultat", "resultat", None),
+    ("Comptes", "comptes", "show_accounts_page"),
+    ("Révision", "revision", "show_revision_page"),
+    ("Paramètres", "parametres", "show_journals_page"),
+)
+# Section Scraping : (attribut du bouton, libellé, icône, méthode)
+_SCRAP_ITEMS = (
+    ("scrap_btn", "Scrap", "scrap", "show_scrap_page"),
+    ("profiles_btn", "Profil Scraping", "profil_scraping", "show_profiles"),
+    ("gallery_btn", "Galerie", "galerie", "show_gallery_tab"),
+)
+# Raccourcis globaux : (touches, méthode, bouton de la barre à activer)
+_SHORTCUTS = (
+    ("Ctrl+1", "show_scrap_page", "scrap_btn"),
+    ("Ctrl+2", "show_profiles", "profiles_btn"),
+    ("Ctrl+3", "show_gallery_tab", "gallery_btn"),
+    ("Ctrl+4", "show_flask_tab", None),
+    ("Ctrl+5", "show_settings", "settings_btn"),
+)
 
 
 class SidebarButton(QPushButton):
@@ -71,31 +166,17 @@ class SidebarButton(QPushButton):
         super().__init__(text)
         if icon:
             self.setIcon(icon)
-        self.setStyleSheet(
-            """
-            QPushButton {
-                padding: 10px;
-                border: none;
-                background-color: #f0f0f0;
-                color: #333;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-            QPushButton:checked {
-                background-color: #c0c0c0;
-                font-weight: bold;
-            }
-            """
-        )
+        self.setProperty("class", "sidebar-btn")
         self.setCheckable(True)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setSizePolicy(_EXPAND, _FIXED)
 
 
 class CollapsibleSection(QWidget):
     """Section with a header button that can show or hide its content."""
 
+    # Variation minimale (px) appliquée pendant l'animation
+    ANIM_STEP_PX = 4
+
     def __init__(
         self,
         title: str,
@@ -109,39 +190,23 @@ class CollapsibleSection(QWidget):
         self.toggle_button = QPushButton(title)
         self.toggle_button.setCheckable(True)
         self.toggle_button.setChecked(False)
-        self.toggle_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #444;
-                color: white;
-                padding: 10px;
-                text-align: left;
-                font-weight: bold;
-            }
-            QPushButton:checked {
-                background-color: #666;
-            }
-            """
-        )
+        self.toggle_button.setProperty("class", "collapsible-header")
 
         self.content_area = QWidget()
         self.content_area.setMaximumHeight(0)
-        self.content_area.setSizePolicy(
-            QSizePolicy.Policy.Expanding,
-            QSizePolicy.Policy.Minimum,
-        )
-        self.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
-        )
-
-        self.toggle_animation = QPropertyAnimation(
-            self.content_area,
-            b"maximumHeight",
-        )
+        self.content_area.setSizePolicy(_EXPAND, _MIN)
+        self.setSizePolicy(_EXPAND, _MIN)
+
+        # Animation "nue" : on n'applique la hauteur que si elle a
+        # suffisamment changé, pour éviter une passe de layout par frame.
+        self._anim_last = 0
+        # Hauteur dépliée mémorisée : évite de reparcourir le layout à chaque clic
+        self._cached_height: int | None = None
+        self.toggle_animation = QVariantAnimation(self)
         self.toggle_animation.setDuration(300)
         self.toggle_animation.setEasingCurve(QEasingCurve.InOutCubic)
-        self.toggle_animation.setStartValue(0)
-        self.toggle_animation.setEndValue(0)
+        self.toggle_animation.valueChanged.connect(self._on_anim_value)
+        self.toggle_animation.finished.connect(self._on_anim_finished)
 
         self.toggle_button.clicked.connect(self.toggle)
         if (
@@ -150,26 +215,40 @@ class CollapsibleSection(QWidget):
         ):
             self.toggle_button.setText("")
 
-        main_layout = QVBoxLayout(self)
+        main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(self.toggle_button)
         main_layout.addWidget(self.content_area)
+        self.setLayout(main_layout)
 
         self.inner_layout = QVBoxLayout()
         self.inner_layout.setContentsMargins(0, 0, 0, 0)
         self.inner_layout.setSpacing(0)
         self.content_area.setLayout(self.inner_layout)
 
+    def _set_content_height(self, h: int) -> None:
+        self._anim_last = h
+        self.content_area.setMaximumHeight(h)
+
+    def _on_anim_value(self, value) -> None:
+        h = int(value)
+        if abs(h - self._anim_last) >= self.ANIM_STEP_PX:
+            self._set_content_height(h)
+
+    def _on_anim_finished(self) -> None:
+        self._set_content_height(int(self.toggle_animation.endValue()))
+
     def toggle(self) -> None:
         checked = self.toggle_button.isChecked()
-        total_height = self.content_area.sizeHint().height()
-        self.toggle_animation.setDirection(
-            QPropertyAnimation.Forward
-            if checked
-            else QPropertyAnimation.Backward
-        )
-        self.toggle_animation.setEndValue(total_height if checked else 0)
-        self.toggle_animation.start()
+        if self._cached_height is None:
+            self._cached_height = self.content_area.sizeHint().height()
+        total_height = self._cached_height
+        anim = self.toggle_animation
+        if anim.state() == QAbstractAnimation.Running:
+            anim.stop()
+        anim.setStartValue(self.content_area.maximumHeight())
+        anim.setEndValue(total_height if checked else 0)
+        anim.start()
         if self.hide_title_when_collapsed:
             self.toggle_button.setText(self.original_title if checked else "")
 
@@ -178,6 +257,16 @@ class CollapsibleSection(QWidget):
             self.toggle_button.setChecked(False)
             self.toggle()
 
+    def collapse_fast(self) -> None:
+        """Replie sans animation (section voisine : pas de 2e animation)."""
+        if not self.toggle_button.isChecked():
+            return
+        self.toggle_button.setChecked(False)
+        self.toggle_animation.stop()
+        self._set_content_height(0)
+        if self.hide_title_when_collapsed:
+            self.toggle_button.setText("")
+
     def expand(self) -> None:
         if not self.toggle_button.isChecked():
             self.toggle_button.setChecked(True)
@@ -185,114 +274,93 @@ class CollapsibleSection(QWidget):
 
     def add_widget(self, widget: QWidget) -> None:
         self.inner_layout.addWidget(widget)
+        self._cached_height = None
+
+    def changeEvent(self, event) -> None:
+        # Police ou style modifiés : la hauteur du contenu peut changer
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self._cached_height = None
+        super().changeEvent(event)
 
 
 class MainWindow(QMainWindow):
     """Main application window with a sidebar and central stack."""
 
+    # Serveur Flask de la galerie (surchargeables par instance ou sous-classe)
+    flask_base_url: str = ""
+    api_key: str | None = None
+
     def __init__(self, theme: ThemeManager | None = None) -> None:
         super().__init__()
         self.theme = theme
         self.settings = self._load_settings()
+        self._settings_written: bytes | None = None
+        # Écritures de settings.json regroupées (changements de thème rapprochés)
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(500)
+        self._settings_timer.timeout.connect(self.save_settings)
         if self.theme:
             self.theme.apply(self.settings.get("theme", "dark"))
         self.setWindowTitle("COMPTA - Interface de gestion comptable")
+        self.setStyleSheet(_SIDEBAR_QSS)
         self.setMinimumSize(1200, 700)
 
+        # Layouts créés sans parent, remplis puis posés une seule fois
         central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-
-        main_layout = QHBoxLayout(central_widget)
+        main_layout = QHBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
 
         sidebar_container = QWidget()
-        sidebar_layout = QVBoxLayout(sidebar_container)
+        sidebar_layout = QVBoxLayout()
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
         sidebar_layout.setSpacing(0)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        scroll_content = QWidget()
-        scroll_content.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum
-        )
-        nav_layout = QVBoxLayout(scroll_content)
+        # Pas de QScrollArea : une seule section dépliée à la fois, la
+        # navigation tient dans la hauteur minimale de la fenêtre (700 px)
+        nav_content = QWidget()
+        nav_content.setSizePolicy(_EXPAND, _EXPAND)
+        nav_layout = QVBoxLayout()
         nav_layout.setContentsMargins(0, 0, 0, 0)
         nav_layout.setSpacing(0)
-        scroll.setWidget(scroll_content)
 
-        sidebar_container.setStyleSheet("background-color: #ffffff;")
-        scroll_content.setStyleSheet("background-color: #ffffff;")
+        sidebar_container.setObjectName("sidebar")
 
-        self.button_group: list[SidebarButton] = []
         self.compta_buttons: dict[str, SidebarButton] = {}
-
+        # Groupe exclusif : un seul signal idClicked pour toute la barre
+        self._nav_group = QButtonGroup(self)
+        self._nav_group.setExclusive(True)
+        self._nav_handlers: list = []
+        self._nav_group.idClicked.connect(self._on_nav_clicked)
 
         self.compta_section = CollapsibleSection(
             "📁 Comptabilité", hide_title_when_collapsed=False
         )
-        compta_items = [
-            ("Tableau de bord", "dashboard", self.show_dashboard_page),
-            ("Journal", "journal", lambda b: self.display_content("Comptabilité : Journal", b)),
-            (
-                "Grand Livre",
-                "grand_livre",
-                lambda b: self.display_content("Comptabilité : Grand Livre", b),
-            ),
-            ("Bilan", "bilan", lambda b: self.display_content("Comptabilité : Bilan", b)),
-            (
-                "Résultat",
-                "resultat",
-                lambda b: self.display_content("Comptabilité : Résultat", b),
-            ),
-            ("Comptes", "comptes", self.show_accounts_page),
-            ("Révision", "revision", self.show_revision_page),
-            ("Paramètres", "parametres", self.show_journals_page),
-        ]
-        for name, icon_name, handler in compta_items:
+        for name, icon_name, handler_name in _COMPTA_ITEMS:
+            handler = getattr(self, handler_name or "_display_compta")
             btn = SidebarButton(name, get_icon(icon_name))
             self.compta_buttons[name] = btn
-            btn.clicked.connect(lambda _, b=btn, h=handler: h(b))
+            self._add_nav_button(btn, handler)
             self.compta_section.add_widget(btn)
-            self.button_group.append(btn)
         nav_layout.addWidget(self.compta_section)
 
         self.scrap_section = CollapsibleSection("🛠️ Scraping")
-
-        self.scrap_btn = SidebarButton("Scrap", get_icon("scrap"))
-        self.scrap_btn.clicked.connect(
-            lambda _, b=self.scrap_btn: self.show_scrap_page(b)
-        )
-        self.scrap_section.add_widget(self.scrap_btn)
-        self.button_group.append(self.scrap_btn)
-
-        self.profiles_btn = SidebarButton(
-            "Profil Scraping", get_icon("profil_scraping")
-        )
-        self.profiles_btn.clicked.connect(
-            lambda _, b=self.profiles_btn: self.show_profiles(b)
-        )
-        self.scrap_section.add_widget(self.profiles_btn)
-        self.button_group.append(self.profiles_btn)
-
-        self.gallery_btn = SidebarButton("Galerie", get_icon("galerie"))
-        self.gallery_btn.clicked.connect(lambda _, b=self.gallery_btn: self.show_gallery_tab())
-        self.scrap_section.add_widget(self.gallery_btn)
-        self.button_group.append(self.gallery_btn)
-
+        for attr, name, icon_name, handler_name in _SCRAP_ITEMS:
+            btn = SidebarButton(name, get_icon(icon_name))
+            setattr(self, attr, btn)
+            self._add_nav_button(btn, getattr(self, handler_name))
+            self.scrap_section.add_widget(btn)
         nav_layout.addWidget(self.scrap_section)
         # Collapse the other section when one is expanded
-        self.compta_section.toggle_button.clicked.connect(
-            lambda: self._collapse_other(self.compta_section)
-        )
-        self.scrap_section.toggle_button.clicked.connect(
-            lambda: self._collapse_other(self.scrap_section)
-        )
+        self._sections = {
+            sec.toggle_button: sec for sec in (self.compta_section, self.scrap_section)
+        }
+        for header in self._sections:
+            header.clicked.connect(self._on_section_header_clicked)
         nav_layout.addStretch()
+        nav_content.setLayout(nav_layout)
 
-        sidebar_layout.addWidget(scroll, 1)
+        sidebar_layout.addWidget(nav_content, 1)
 
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
@@ -300,192 +368,256 @@ class MainWindow(QMainWindow):
         sidebar_layout.addWidget(line)
 
         self.settings_btn = SidebarButton("Paramètres", get_icon("parametres"))
-        self.settings_btn.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed
-        )
+        self.settings_btn.setSizePolicy(_EXPAND, _FIXED)
         self.settings_btn.setMinimumHeight(34)
         self.settings_btn.setEnabled(True)
         self.settings_btn.setObjectName("sidebar-item")
-        self.settings_btn.clicked.connect(
-            lambda _, b=self.settings_btn: self.show_settings(b)
-        )
-        self.button_group.append(self.settings_btn)
+        self._add_nav_button(self.settings_btn, self.show_settings)
         sidebar_layout.addWidget(self.settings_btn)
+        sidebar_container.setLayout(sidebar_layout)
         self.stack = AnimatedStack()
         self.stack.addWidget(
             QLabel("Bienvenue sur COMPTA", alignment=Qt.AlignCenter)
         )
 
-        self.profile_page = ProfileWidget()
-        self.stack.addWidget(self.profile_page)
+        # Pages construites à la première ouverture (démarrage plus léger)
+        self.app_ctx = AppContext(self)
+        self._pages: dict[str, QWidget] = {}
+        self._page_factories = {
+            "profile": self._build_profile_page,
+            "scrap": self._build_scrap_page,
+            "gallery": self._build_gallery_page,
+            "dashboard": self._build_dashboard_page,
+            "achat": self._build_achat_page,
+            "suppliers": self._build_suppliers_page,
+            "accounts": self._build_accounts_page,
+            "journals": self._build_journals_page,
+            "revision": self._build_revision_page,
+            "ventes": self._build_ventes_page,
+            "settings": self._build_settings_page,
+            # Page texte partagée par les entrées sans écran dédié
+            "placeholder": lambda: QLabel(alignment=Qt.AlignCenter),
+        }
 
-        self.scrap_page = ScrapWidget()
-        self.stack.addWidget(self.scrap_page)
+        main_layout.addWidget(sidebar_container, 1)
+        main_layout.addWidget(self.stack, 4)
+        central_widget.setLayout(main_layout)
+        self.setCentralWidget(central_widget)
 
+        # Install global shortcuts
+        self._install_shortcuts()
 
-        base_url = getattr(self, "flask_base_url", "")
-        api_key = getattr(self, "api_key", None)
-        self.gallery_page = GalleryWidget(self, base_url=base_url, api_key=api_key)
-        self.stack.addWidget(self.gallery_page)
+    # ------------------------------------------------------------------
+    # Pages paresseuses
+    # ------------------------------------------------------------------
+    def _get_page(self, key: str) -> QWidget:
+        page = self._pages.get(key)
+        if page is None:
+            page = self._page_factories[key]()
+            self._pages[key] = page
+            self.stack.addWidget(page)
+        return page
+
+    def _build_profile_page(self) -> QWidget:
+        from MOTEUR.scraping.widgets.profile_widget import ProfileWidget
+
+        page = ProfileWidget()
+        images_widget = self._get_page("scrap").images_widget
+        page.profile_chosen.connect(images_widget.set_selected_profile)
+        page.profiles_updated.connect(images_widget.refresh_profiles)
+        return page
+
+    def _build_scrap_page(self) -> QWidget:
+        from MOTEUR.scraping.widgets.scrap_widget import ScrapWidget
+
+        page = ScrapWidget()
+        # Raccourcis propres à la page, installés avec elle
+        for key, meth in (
+            ("Ctrl+L", "start_scan"),
+            ("Ctrl+C", "copy_links_to_clipboard"),
+            ("Ctrl+D", "dedupe_links"),
+            ("Ctrl+E", "export_links_csv"),
+        ):
+            fn = getattr(page, meth, None)
+            if fn is not None:
+                self._add_shortcut(key, fn)
+        return page
 
-        self.profile_page.profile_chosen.connect(
-            self.scrap_page.images_widget.set_selected_profile
-        )
-        self.profile_page.profiles_updated.connect(
-            self.scrap_page.images_widget.refresh_profiles
-        )
+    def _build_gallery_page(self) -> QWidget:
+        from gallery_widget import GalleryWidget
 
-        self.dashboard_page = DashboardWidget()
-        self.dashboard_page.journal_requested.connect(
-            lambda: self.open_from_dashboard("Journal")
+        return GalleryWidget(
+            self, base_url=self.flask_base_url, api_key=self.api_key
         )
-        self.dashboard_page.grand_livre_requested.connect(
+
+    def _build_dashboard_page(self) -> QWidget:
+        from MOTEUR.compta.dashboard.widget import DashboardWidget
+
+        page = DashboardWidget()
+        page.journal_requested.connect(lambda: self.open_from_dashboard("Journal"))
+        page.grand_livre_requested.connect(
             lambda: self.open_from_dashboard("Grand Livre")
         )
-        self.dashboard_page.scraping_summary_requested.connect(
+        page.scraping_summary_requested.connect(
             lambda: self.show_scrap_page(self.scrap_btn)
         )
-        self.stack.addWidget(self.dashboard_page)
-
-        self.achat_page = AchatWidget()
-        self.stack.addWidget(self.achat_page)
+        return page
 
+    def _build_suppliers_page(self) -> QWidget:
         from MOTEUR.compta.suppliers import SupplierTab
 
-        self.suppliers_page = SupplierTab()
-        self.stack.addWidget(self.suppliers_page)
+        return SupplierTab()
 
-        self.accounts_page = AccountWidget()
-        self.accounts_page.accounts_updated.connect(
-            self.achat_page.refresh_accounts
-        )
-        self.stack.addWidget(self.accounts_page)
+    def _build_achat_page(self) -> QWidget:
+        from MOTEUR.compta.achats.widget import AchatWidget
+
+        return AchatWidget()
+
+    def _build_accounts_page(self) -> QWidget:
+        from MOTEUR.compta.accounting.widget import AccountWidget
+
+        page = AccountWidget()
+        page.accounts_updated.connect(self._on_accounts_updated)
+        return page
 
+    def _on_accounts_updated(self) -> None:
+        # La page Achats relit les comptes à sa création : inutile de la forcer
+        achat_page = self._pages.get("achat")
+        if achat_page is not None:
+            achat_page.refresh_accounts()
+
+    def _build_journals_page(self) -> QWidget:
         from MOTEUR.compta.parameters import JournalsWidget
 
-        self.journals_page = JournalsWidget()
-        self.stack.addWidget(self.journals_page)
+        return JournalsWidget()
 
+    def _build_revision_page(self) -> QWidget:
         from MOTEUR.compta.revision import RevisionTab
 
-        self.revision_page = RevisionTab()
-        self.stack.addWidget(self.revision_page)
+        return RevisionTab()
 
-        self.ventes_page = VenteWidget()
-        self.stack.addWidget(self.ventes_page)
+    def _build_ventes_page(self) -> QWidget:
+        from MOTEUR.compta.ventes.widget import VenteWidget
 
-        self.app_ctx = AppContext(self)
-        self.settings_page = SettingsPage(self.app_ctx, self)
-        self.stack.addWidget(self.settings_page)
+        return VenteWidget()
 
-        main_layout.addWidget(sidebar_container, 1)
-        main_layout.addWidget(self.stack, 4)
+    def _build_settings_page(self) -> QWidget:
+        from localapp.pages.settings_page import SettingsPage
 
-        # Install global shortcuts
-        self._install_shortcuts()
+        return SettingsPage(self.app_ctx, self)
+
+    def _add_nav_button(self, btn: SidebarButton, handler) -> None:
+        self._nav_group.addButton(btn, len(self._nav_handlers))
+        self._nav_handlers.append(handler)
+
+    @property
+    def button_group(self) -> list[SidebarButton]:
+        """Boutons de navigation, dans l'ordre d'ajout (tenus par le groupe)."""
+        return self._nav_group.buttons()
+
+    @Slot(int)
+    def _on_nav_clicked(self, idx: int) -> None:
+        self._nav_handlers[idx](self._nav_group.button(idx))
 
     def clear_selection(self) -> None:
-        for btn in self.button_group:
+        # Un groupe exclusif refuse de tout décocher : on le relâche un instant
+        btn = self._nav_group.checkedButton()
+        if btn is not None:
+            self._nav_group.setExclusive(False)
             btn.setChecked(False)
+            self._nav_group.setExclusive(True)
+
+    def _set_active(self, btn: SidebarButton) -> None:
+        """Coche ``btn`` ; le groupe exclusif décoche l'ancien bouton."""
+        btn.setChecked(True)
+
+    @Slot()
+    def _on_section_header_clicked(self) -> None:
+        section = self._sections.get(self.sender())
+        if section is not None:
+            self._collapse_other(section)
 
     def _collapse_other(self, active: CollapsibleSection) -> None:
         if active.toggle_button.isChecked():
             other = (
                 self.scrap_section if active is self.compta_section else self.compta_section
             )
-            other.collapse()
+            other.collapse_fast()
+
+    def _add_shortcut(self, key: str, fn) -> None:
+        QShortcut(_key_sequence(key), self, activated=fn)
 
     def _install_shortcuts(self) -> None:
-        def add(key: str, fn):
-            sc = QShortcut(QKeySequence(key), self)
-            sc.activated.connect(fn)
-
-        if hasattr(self, "show_scrap_page"):
-            add("Ctrl+1", lambda: self.show_scrap_page(self.scrap_btn))
-        if hasattr(self, "show_profiles"):
-            add("Ctrl+2", lambda: self.show_profiles(self.profiles_btn))
-        if hasattr(self, "show_gallery_tab"):
-            add("Ctrl+3", self.show_gallery_tab)
-        if hasattr(self, "show_flask_tab"):
-            add("Ctrl+4", self.show_flask_tab)
-        if hasattr(self, "show_settings"):
-            add("Ctrl+5", lambda: self.show_settings(self.settings_btn))
-
-        target = getattr(self, "scrap_page", None)
-        if target and hasattr(target, "start_scan"):
-            add("Ctrl+L", target.start_scan)
-        if target and hasattr(target, "copy_links_to_clipboard"):
-            add("Ctrl+C", target.copy_links_to_clipboard)
-        if target and hasattr(target, "dedupe_links"):
-            add("Ctrl+D", target.dedupe_links)
-        if target and hasattr(target, "export_links_csv"):
-            add("Ctrl+E", target.export_links_csv)
+        for key, meth, btn_attr in _SHORTCUTS:
+            fn = getattr(self, meth, None)
+            if fn is None:
+                continue
+            if btn_attr is not None:
+                fn = partial(fn, getattr(self, btn_attr))
+            self._add_shortcut(key, fn)
 
     def display_content(self, text: str, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        label = QLabel(text, alignment=Qt.AlignCenter)
-        self.stack.addWidget(label)
+        self._set_active(button)
+        label = self._get_page("placeholder")
+        label.setText(text)
         self.stack.setCurrentWidget(label)
 
+    def _display_compta(self, button: SidebarButton) -> None:
+        self.display_content(f"Comptabilité : {button.text()}", button)
+
     def show_scrap_page(self, button: SidebarButton, tab_index: int = 0) -> None:
-        self.clear_selection()
-        button.setChecked(True)
+        self._set_active(button)
         try:
-            self.scrap_page.tabs.setCurrentIndex(tab_index)
+            self._get_page("scrap").tabs.setCurrentIndex(tab_index)
         except Exception:
             pass
-        self.stack.setCurrentWidget(self.scrap_page)
+        self.stack.setCurrentWidget(self._get_page("scrap"))
 
     def show_scraping_images(self, button: SidebarButton) -> None:
         self.show_scrap_page(button, tab_index=0)
 
     def show_profiles(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.stack.setCurrentWidget(self.profile_page)
+        self._set_active(button)
+        self.stack.setCurrentWidget(self._get_page("profile"))
 
-    def show_gallery_tab(self) -> None:
-        self.clear_selection()
-        if hasattr(self, "gallery_btn"):
-            self.gallery_btn.setChecked(True)
-        self.stack.setCurrentWidget(self.gallery_page)
+    def show_gallery_tab(self, button: SidebarButton | None = None) -> None:
+        button = button or getattr(self, "gallery_btn", None)
+        if button is not None:
+            self._set_active(button)
+        else:
+            self.clear_selection()
+        self.stack.setCurrentWidget(self._get_page("gallery"))
 
     def show_dashboard_page(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.dashboard_page.refresh()
-        self.stack.setCurrentWidget(self.dashboard_page)
+        self._set_active(button)
+        page = self._get_page("dashboard")
+        self.stack.setCurrentWidget(page)
+        # Données rechargées au tour de boucle suivant : la page s'affiche d'abord
+        QTimer.singleShot(0, page.refresh)
 
     def show_accounts_page(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.stack.setCurrentWidget(self.accounts_page)
+        self._set_active(button)
+        self.stack.setCurrentWidget(self._get_page("accounts"))
 
     def show_revision_page(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.stack.setCurrentWidget(self.revision_page)
+        self._set_active(button)
+        self.stack.setCurrentWidget(self._get_page("revision"))
 
     def show_journals_page(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.stack.setCurrentWidget(self.journals_page)
+        self._set_active(button)
+        self.stack.setCurrentWidget(self._get_page("journals"))
 
     def show_achat_page(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.stack.setCurrentWidget(self.achat_page)
+        self._set_active(button)
+        self.stack.setCurrentWidget(self._get_page("achat"))
 
     def show_suppliers_page(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.stack.setCurrentWidget(self.suppliers_page)
+        self._set_active(button)
+        self.stack.setCurrentWidget(self._get_page("suppliers"))
 
     def show_ventes_page(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.stack.setCurrentWidget(self.ventes_page)
+        self._set_active(button)
+        self.stack.setCurrentWidget(self._get_page("ventes"))
 
     def open_from_dashboard(self, name: str) -> None:
         btn = self.compta_buttons.get(name)
@@ -493,24 +625,44 @@ class MainWindow(QMainWindow):
             self.display_content(f"Comptabilité : {name}", btn)
 
     def show_settings(self, button: SidebarButton) -> None:
-        self.clear_selection()
-        button.setChecked(True)
-        self.stack.setCurrentWidget(self.settings_page)
+        self._set_active(button)
+        self.stack.setCurrentWidget(self._get_page("settings"))
 
     def _load_settings(self) -> dict:
-        try:
-            return json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
+        global _SETTINGS_CACHE
+        if _SETTINGS_CACHE is None:
+            try:
+                _SETTINGS_CACHE = _json_loads(SETTINGS_FILE.read_bytes())
+            except Exception:
+                _SETTINGS_CACHE = {}
+        # copie : chaque fenêtre modifie ses propres réglages
+        return dict(_SETTINGS_CACHE)
+
+    def schedule_save_settings(self) -> None:
+        """Enregistre ``settings`` après 500 ms sans nouvelle modification."""
+        self._settings_timer.start()
 
     def save_settings(self) -> None:
+        global _SETTINGS_CACHE
+        self._settings_timer.stop()
         try:
-            SETTINGS_FILE.write_text(
-                json.dumps(self.settings, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            data = _json_dumps(self.settings)
+            if data == self._settings_written:
+                return  # rien n'a changé depuis la dernière écriture
+            from MOTEUR.common.fileio import write_bytes_atomic
+
+            # fichier temporaire + os.replace : jamais de settings.json tronqué
+            write_bytes_atomic(SETTINGS_FILE, data)
         except Exception as e:
             print_safe(f"Could not save settings: {e}")
+        else:
+            self._settings_written = data
+            _SETTINGS_CACHE = dict(self.settings)
+
+    def closeEvent(self, event) -> None:
+        if self._settings_timer.isActive():
+            self.save_settings()
+        super().closeEvent(event)
 
 
 class AppContext:
@@ -522,7 +674,7 @@ class AppContext:
         if self.mw.theme:
             self.mw.theme.apply(theme)
         self.mw.settings["theme"] = theme
-        self.mw.save_settings()
+        self.mw.schedule_save_settings()
 
     def current_theme(self) -> str:
         return self.mw.settings.get("theme", "dark")
@@ -531,14 +683,26 @@ class AppContext:
         print_safe(msg)
 
 
+def _arm_crash_log(path: Path) -> None:
+    """Ouvre crash.log et arme le dump périodique des tracebacks.
+
+    ``dump_traceback_later`` exige un vrai descripteur de fichier : on ne peut
+    pas le remplacer par un objet paresseux, on retarde donc seulement
+    l'ouverture après le premier affichage de la fenêtre.
+    """
+    import faulthandler
+
+    try:
+        faulthandler.dump_traceback_later(30, repeat=True, file=open_utf8(path, "a"))
+    except Exception:
+        pass
+
 
 if __name__ == "__main__":
-    import faulthandler, pathlib
+    import faulthandler
 
-    path = pathlib.Path("crash.log")
     try:
         faulthandler.enable(all_threads=True)
-        faulthandler.dump_traceback_later(30, repeat=True, file=open_utf8(path, "a"))
     except Exception:
         pass
 
@@ -550,4 +714,8 @@ if __name__ == "__main__":
     theme = ThemeManager(app)
     interface = MainWindow(theme)
     interface.show()
+    # Dump périodique (thread + crash.log) seulement sur demande :
+    # COMPTA_FAULTHANDLER=1 ; jamais avant que la fenêtre soit affichée
+    if os.environ.get("COMPTA_FAULTHANDLER"):
+        QTimer.singleShot(0, lambda: _arm_crash_log(Path("crash.log")))
     sys.exit(app.exec())
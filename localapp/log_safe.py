@@ -25,7 +25,7 @@ def print_safe(*args: Any, sep: str=" ", end: str="\n"):
         _safe_write(out, s.rstrip("\n"))
 
 
-def open_utf8(path: str, mode: str="r"):
+def open_utf8(path: str, mode: str="r", buffering: int=-1):
     if "b" in mode:
-        return open(path, mode)
-    return open(path, mode, encoding="utf-8", errors="replace")
+        return open(path, mode, buffering)
+    return open(path, mode, buffering, encoding="utf-8", errors="replace")
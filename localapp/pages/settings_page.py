@@ -11,13 +11,38 @@ from PySide6.QtWidgets import (
     QCheckBox,
     QGroupBox,
 )
-from PySide6.QtCore import QProcess, Qt
-from localapp.utils_collect import detect_project_root, build_copy_txt
+from PySide6.QtCore import QObject, QProcess, QRunnable, QThreadPool, Qt, Signal, Slot
 try:
     from localapp.ui_animations import toast
 except Exception:
     toast = lambda *a, **k: None
 
+
+class _CopyTxtSignals(QObject):
+    done = Signal(dict)
+    failed = Signal(str)
+
+
+class _CopyTxtJob(QRunnable):
+    """Génère copy.txt hors du thread GUI (parcours disque + écriture)."""
+
+    def __init__(self, root: Path, out_path: Path, signals: _CopyTxtSignals):
+        super().__init__()
+        self.root = root
+        self.out_path = out_path
+        self.signals = signals
+
+    def run(self):
+        try:
+            from localapp.utils_collect import build_copy_txt
+
+            stats = build_copy_txt(self.root, self.out_path)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.done.emit(stats)
+
+
 class SettingsPage(QWidget):
     def __init__(self, app_ctx, parent=None):
         """
@@ -30,6 +55,11 @@ class SettingsPage(QWidget):
         super().__init__(parent)
         self.app_ctx = app_ctx
         self.proc = None
+        # Racine du projet détectée au premier clic sur « Mettre à jour le txt »
+        self._copy_root: Path | None = None
+        self._copy_signals = _CopyTxtSignals(self)
+        self._copy_signals.done.connect(self._on_copy_txt_done)
+        self._copy_signals.failed.connect(self._on_copy_txt_failed)
 
         root = QVBoxLayout(self)
 
@@ -84,7 +114,7 @@ class SettingsPage(QWidget):
             self._on_update_copy_txt,
             Qt.ConnectionType.UniqueConnection
         )
-        self.chk_dark.stateChanged.connect(self._on_theme_toggled)
+        self.chk_dark.toggled.connect(self._on_theme_toggled)
 
     # ==== Actions ====
     def _append(self, text: str):
@@ -122,25 +152,37 @@ class SettingsPage(QWidget):
         self._restart_app()
 
     def _on_update_copy_txt(self):
-        # racine du projet
-        root = detect_project_root(Path(__file__).resolve())
+        # racine du projet (import et recherche faits une seule fois)
+        root = self._copy_root
+        if root is None:
+            from localapp.utils_collect import detect_project_root
+
+            root = self._copy_root = detect_project_root(Path(__file__).resolve())
         out_path = root / "copy.txt"
-        stats = build_copy_txt(root, out_path)
+        # le parcours tourne dans le pool : on bloque la ré-entrée
+        self.btn_update_txt.setEnabled(False)
+        self._append("Génération de copy.txt…")
+        QThreadPool.globalInstance().start(_CopyTxtJob(root, out_path, self._copy_signals))
+
+    def _on_copy_txt_done(self, stats: dict):
+        self.btn_update_txt.setEnabled(True)
         # log UI
-        try:
-            self.console.appendPlainText(
-                f"copy.txt mis à jour: {stats['files']} fichiers, {stats['bytes']} octets → {stats['out']}"
-            )
-        except Exception:
-            pass
+        self._append(
+            f"copy.txt mis à jour: {stats['files']} fichiers, {stats['bytes']} octets → {stats['out']}"
+        )
         toast(self, "copy.txt mis à jour", "success")
 
+    def _on_copy_txt_failed(self, err: str):
+        self.btn_update_txt.setEnabled(True)
+        self._append(f"❌ Erreur génération copy.txt : {err}")
+
     # ==== Thème ====
     def _update_theme_label(self):
         self.lbl_theme.setText("Mode sombre" if self.chk_dark.isChecked() else "Mode clair")
 
-    def _on_theme_toggled(self, state):
-        theme = "dark" if self.chk_dark.isChecked() else "light"
+    @Slot(bool)
+    def _on_theme_toggled(self, checked: bool):
+        theme = "dark" if checked else "light"
         self.app_ctx.apply_theme(theme)
         self._update_theme_label()
         self._append(f"Thème appliqué: {theme}")
@@ -1,24 +1,35 @@
+from functools import lru_cache
+
 from PySide6.QtWidgets import QApplication, QStyle
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import QResource
 
+# Icônes standard Qt par nom logique (construit une seule fois, pas à chaque appel)
+_STANDARD_ICONS = {
+    "dashboard": QStyle.SP_ComputerIcon,
+    "journal": QStyle.SP_FileIcon,
+    "grand_livre": QStyle.SP_DirIcon,
+    "bilan": QStyle.SP_DialogApplyButton,
+    "resultat": QStyle.SP_DialogOkButton,
+    "comptes": QStyle.SP_DirHomeIcon,
+    "revision": getattr(QStyle, "SP_BrowserReload", QStyle.SP_BrowserStop),
+    "parametres": QStyle.SP_FileDialogDetailedView,
+    "scrap": QStyle.SP_MediaPlay,
+    "profil_scraping": QStyle.SP_FileDialogInfoView,
+    "galerie": QStyle.SP_DirOpenIcon,
+}
+
 def get_icon(name: str) -> QIcon:
-    st = QApplication.style()
-    mp = {
-        "dashboard": QStyle.SP_ComputerIcon,
-        "journal": QStyle.SP_FileIcon,
-        "grand_livre": QStyle.SP_DirIcon,
-        "bilan": QStyle.SP_DialogApplyButton,
-        "resultat": QStyle.SP_DialogOkButton,
-        "comptes": QStyle.SP_DirHomeIcon,
-        "revision": getattr(QStyle, "SP_BrowserReload", QStyle.SP_BrowserStop),
-        "parametres": QStyle.SP_FileDialogDetailedView,
-        "scrap": QStyle.SP_MediaPlay,
-        "profil_scraping": QStyle.SP_FileDialogInfoView,
-        "galerie": QStyle.SP_DirOpenIcon,
-    }
-    if name in mp:
-        return st.standardIcon(mp[name])
+    """QIcon partagée par nom, pour le style Qt courant."""
+    return _cached_icon(name, QApplication.style().name())
+
+
+@lru_cache(maxsize=64)
+def _cached_icon(name: str, style_name: str) -> QIcon:
+    # clé : nom + style courant (les icônes standard changent avec setStyle)
+    sp = _STANDARD_ICONS.get(name)
+    if sp is not None:
+        return QApplication.style().standardIcon(sp)
     path = f":/icons/{name}.svg"
     if QResource.registerResource:
         return QIcon(path)
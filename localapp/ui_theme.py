@@ -4,6 +4,14 @@ from pathlib import Path
 from PySide6.QtCore import QObject, Signal, QFile, QIODevice, QSettings
 from PySide6.QtGui import QFontDatabase, QPalette, QColor
 
+# Identifiant de la police Inter enregistrée (None = pas encore tenté).
+# L'enregistrement est fait une seule fois par processus.
+_INTER_FONT_ID: int | None = None
+
+# Feuilles QSS déjà lues (chemin -> texte) : basculer de thème ne relit
+# pas la ressource. Les lectures vides ne sont pas mémorisées.
+_QSS_CACHE: dict[str, str] = {}
+
 
 class ThemeManager(QObject):
     theme_changed = Signal(str)
@@ -21,7 +29,13 @@ class ThemeManager(QObject):
         Charge la police Inter depuis le qrc seulement si la ressource existe
         ET a une taille cohérente. En cas d'échec, on ignore silencieusement
         pour éviter le spam 'qt.qpa.fonts' (DirectWrite).
+        Le résultat est mémorisé au niveau du module : les ThemeManager
+        suivants ne relisent pas la ressource.
         """
+        global _INTER_FONT_ID
+        if _INTER_FONT_ID is not None:
+            return
+        _INTER_FONT_ID = -1
         try:
             f = QFile(":/fonts/Inter-Regular.ttf")
             if not f.exists():
@@ -38,17 +52,26 @@ class ThemeManager(QObject):
             if head not in (b"\x00\x01\x00\x00", b"OTTO"):  # TTF or OTF(CFF)
                 return
 
-            fid = QFontDatabase.addApplicationFont(":/fonts/Inter-Regular.ttf")
-            if fid == -1:
-                # si la police n'est pas acceptée, on n'insiste pas
-                return
+            # si la police n'est pas acceptée (-1), on n'insiste pas
+            _INTER_FONT_ID = QFontDatabase.addApplicationFontFromData(data)
         except Exception:
             # Ne jamais bloquer le démarrage sur la police
             return
 
     def _load_qss(self, path: str) -> str:
         """
-        Charge un fichier QSS en UTF-8.
+        Charge un fichier QSS en UTF-8 (mémorisé dans ``_QSS_CACHE``).
+        """
+        qss = _QSS_CACHE.get(path)
+        if qss is None:
+            qss = self._read_qss(path)
+            if qss:
+                _QSS_CACHE[path] = qss
+        return qss
+
+    def _read_qss(self, path: str) -> str:
+        """
+        Lit un fichier QSS en UTF-8.
         - Tente d'abord la ressource Qt (ex: :/themes/dark.qss)
         - Si absente, fallback vers un fichier sur disque: <dir>/themes/<name>.qss
         """
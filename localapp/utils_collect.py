@@ -26,25 +26,43 @@ def detect_project_root(start: Path | None = None) -> Path:
     # fallback: deux niveaux au-dessus de /localapp/
     return Path(__file__).resolve().parents[1]
 
-def iter_sources(root: Path, *, out_path: Path | None = None) -> Iterable[Path]:
-    """Parcourt root en ignorant dossiers poubelles; garde extensions whitelistées, < MAX_BYTES, et exclut out_path."""
-    for dirpath, dirnames, filenames in os.walk(root):
-        # prune des dossiers ignorés
-        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS]
-        for fn in filenames:
-            p = Path(dirpath) / fn
-            # exclure copy.txt lui-même
-            if out_path and p.resolve() == out_path.resolve():
-                continue
-            ext = p.suffix.lower()
-            if ext not in ALLOWED_EXTS:
-                continue
+def _scan(dirpath: str, skip: str | None) -> Iterable[Path]:
+    """Parcours récursif via os.scandir (DirEntry met en cache type et stat)."""
+    try:
+        it = os.scandir(dirpath)
+    except OSError:
+        return
+    with it:
+        for e in it:
             try:
-                if p.stat().st_size > MAX_BYTES:
+                if e.is_dir(follow_symlinks=False):
+                    if e.name not in IGNORE_DIRS:
+                        yield from _scan(e.path, skip)
+                    continue
+                if not e.is_file():
                     continue
-            except Exception:
+                _, dot, ext = e.name.rpartition(".")
+                if not dot or "." + ext.lower() not in ALLOWED_EXTS:
+                    continue
+                if e.path == skip or e.stat().st_size > MAX_BYTES:
+                    continue
+            except OSError:
                 continue
-            yield p
+            yield Path(e.path)
+
+def iter_sources(root: Path, *, out_path: Path | None = None) -> Iterable[Path]:
+    """Parcourt root en ignorant dossiers poubelles; garde extensions whitelistées, < MAX_BYTES, et exclut out_path."""
+    root = Path(root)
+    # exclure copy.txt lui-même (chemin comparé tel que produit par scandir)
+    skip = None
+    if out_path is not None:
+        try:
+            rel = Path(out_path).resolve().relative_to(root.resolve())
+            # même construction que DirEntry.path : str(root) + sep + nom...
+            skip = os.path.join(str(root), *rel.parts)
+        except ValueError:
+            skip = None
+    yield from _scan(str(root), skip)
 
 def build_copy_txt(root: Path, out_path: Path) -> dict:
     """Construit copy.txt; renvoie stats."""
@@ -55,7 +73,7 @@ def build_copy_txt(root: Path, out_path: Path) -> dict:
     written_bytes = 0
     written_files = 0
     now = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
-    with open(out_path, "w", encoding="utf-8", errors="replace") as out:
+    with open(out_path, "w", encoding="utf-8", errors="replace", buffering=1 << 18) as out:
         out.write("# copy.txt regénéré automatiquement\n")
         out.write(f"# {now}\n\n")
         for fp in files:
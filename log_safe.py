@@ -23,8 +23,8 @@ def print_safe(*args: Any, sep: str=" ", end: str="\n"):
     except Exception:
         _safe_write(out, s.rstrip("\n"))
 
-def open_utf8(path: str, mode: str="r"):
+def open_utf8(path: str, mode: str="r", buffering: int=-1):
     # Ouvre un fichier texte en UTF-8 avec remplacement robuste
     if "b" in mode:
-        return open(path, mode)  # binaire: inchangé
-    return open(path, mode, encoding="utf-8", errors="replace")
+        return open(path, mode, buffering)  # binaire: inchangé
+    return open(path, mode, buffering, encoding="utf-8", errors="replace")
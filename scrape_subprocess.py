@@ -7,9 +7,9 @@ force_utf8_stdio()
 
 # Logs robustes (print_safe)
 try:
-    from localapp.log_safe import print_safe, open_utf8
+    from localapp.log_safe import print_safe
 except ImportError:
-    from log_safe import print_safe, open_utf8
+    from log_safe import print_safe
 
 import sys
 import json
@@ -18,6 +18,7 @@ from selenium.webdriver.common.by import By
 
 from MOTEUR.scraping.image_scraper import scrape_images, scrape_variants
 from MOTEUR.scraping import history
+from MOTEUR.common.fileio import read_lines_txt
 
 
 def main():
@@ -33,8 +34,7 @@ def main():
     }
     print_safe(json.dumps({"event": "start", "cfg": cfg}))
     sys.stdout.flush()
-    with open_utf8(cfg["input"]) as f:
-        urls = [u.strip() for u in f if u.strip()]
+    urls = read_lines_txt(cfg["input"])
     total_urls = len(urls)
     for i, url in enumerate(urls, 1):
         try:
@@ -44,8 +44,8 @@ def main():
                     driver.find_element(By.TAG_NAME, "h1")
                 except Exception:
                     pass
+                # driver mis en cache par scrape_images : libéré à la sortie (atexit)
                 variants = scrape_variants(driver)
-                driver.quit()
             else:
                 total = scrape_images(url, cfg["selector"], cfg["folder"])
                 variants = {}
@@ -1,4 +1,5 @@
 import time
+from io import BytesIO
 from pathlib import Path
 import os, sys
 
@@ -89,3 +90,43 @@ def test_image_edit_validation_errors(tmp_path):
     )
     assert resp.status_code == 400
     assert resp.get_json()["detail"] == "source.folder is empty"
+
+
+def test_files_raw_thumbnail(tmp_path):
+    img = Image.new("RGB", (400, 200), "blue")
+    img.save(tmp_path / "big.png")
+
+    srv = FlaskBridgeServer()
+    srv.api_key = "k"
+    client = srv.app.test_client()
+
+    resp = client.get(
+        "/files/raw",
+        query_string={"folder": str(tmp_path), "name": "big.png", "w": 100, "h": 100},
+        headers={"X-API-KEY": "k"},
+    )
+    assert resp.status_code == 200
+    assert resp.mimetype == "image/jpeg"
+    with Image.open(BytesIO(resp.data)) as thumb:
+        assert thumb.size == (100, 50)
+
+    resp = client.get(
+        "/files/raw",
+        query_string={"folder": str(tmp_path), "name": "big.png"},
+        headers={"X-API-KEY": "k"},
+    )
+    assert resp.mimetype == "image/png"
+
+    # transparence aplatie sur fond blanc (et non noir) dans la vignette
+    Image.new("RGBA", (400, 400), (0, 0, 0, 0)).save(tmp_path / "alpha.png")
+    Image.new("RGBA", (400, 400), (0, 0, 0, 0)).save(tmp_path / "alpha.webp")
+    Image.new("P", (400, 400), 0).save(tmp_path / "alpha_p.png", transparency=0)
+    for name in ("alpha.png", "alpha.webp", "alpha_p.png"):
+        resp = client.get(
+            "/files/raw",
+            query_string={"folder": str(tmp_path), "name": name, "w": 100, "h": 100},
+            headers={"X-API-KEY": "k"},
+        )
+        assert resp.status_code == 200
+        with Image.open(BytesIO(resp.data)) as thumb:
+            assert thumb.convert("RGB").getpixel((0, 0)) >= (250, 250, 250)
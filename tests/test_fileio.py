@@ -0,0 +1,51 @@
+from pathlib import Path
+import json
+import sys
+import threading
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from MOTEUR.common.fileio import write_json_atomic
+
+
+def test_write_json_atomic_concurrent_writers(tmp_path: Path):
+    target = tmp_path / "state.json"
+    errors: list[Exception] = []
+
+    def writer(n: int) -> None:
+        for i in range(100):
+            try:
+                write_json_atomic(target, {"writer": n, "i": i})
+            except Exception as e:  # pragma: no cover - échec du test
+                errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert json.loads(target.read_text(encoding="utf-8"))["i"] == 99
+    # aucun fichier temporaire laissé derrière
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_write_bytes_atomic_keeps_old_file_on_failure(tmp_path: Path, monkeypatch):
+    from MOTEUR.common import fileio
+
+    target = tmp_path / "settings.json"
+    target.write_bytes(b'{"theme": "dark"}')
+
+    def boom(src, dst):
+        raise OSError("disque plein")
+
+    monkeypatch.setattr(fileio.os, "replace", boom)
+    with pytest.raises(OSError):
+        fileio.write_bytes_atomic(target, b'{"theme": "light"}')
+    assert target.read_bytes() == b'{"theme": "dark"}'
+    assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
@@ -34,11 +34,11 @@ def test_scrape_logs_history(tmp_path, monkeypatch):
 
     monkeypatch.setattr(
         "MOTEUR.scraping.widgets.image_worker.scrape_images",
-        lambda url, sel, folder, keep_driver=False: 5,
+        lambda url, sel, folder, keep_driver=False, **_: 5,
     )
 
     widget._start()
-    while widget._thread.isRunning():
+    while widget.is_running():
         app.processEvents()
 
     entries = history.load_history()
@@ -56,8 +56,8 @@ def test_export_excel(tmp_path, monkeypatch):
     app = QApplication.instance() or QApplication([])
     widget = ImageScraperWidget()
     widget.export_data = [
-        {"URL": "u1", "Variant": "v1", "Image": "img1"},
-        {"URL": "u2", "Variant": "v2", "Image": "img2"},
+        ("u1", "v1", "img1"),
+        ("u2", "v2", "img2"),
     ]
 
     out_file = tmp_path / "out.xlsx"
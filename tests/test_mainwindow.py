@@ -20,3 +20,18 @@ def test_mainwindow_creation():
     window = MainWindow()
     assert window.windowTitle() == "COMPTA - Interface de gestion comptable"
     window.close()
+
+
+def test_display_content_reuses_placeholder():
+    app = QApplication.instance() or QApplication([])
+    window = MainWindow()
+    journal = window.compta_buttons["Journal"]
+    bilan = window.compta_buttons["Bilan"]
+    journal.click()
+    count = window.stack.count()
+    bilan.click()
+    journal.click()
+    assert window.stack.count() == count
+    assert window.stack.currentWidget().text() == "Comptabilité : Journal"
+    assert journal.isChecked() and not bilan.isChecked()
+    window.close()
@@ -47,3 +47,15 @@ def test_profile_persistence(tmp_path: Path):
     # Reload from disk to verify persistence
     new_list = pm.load_profiles()
     assert new_list == [{"name": "persist", "selector": ".x"}]
+
+
+def test_load_profiles_returns_copies(tmp_path: Path):
+    """Cached profiles must not leak mutations between callers."""
+    pm.PROFILES_FILE = tmp_path / "profiles.json"
+    pm.save_profiles([{"name": "a", "selector": ".a"}])
+
+    first = pm.load_profiles()
+    first[0]["selector"] = "changed"
+    first.append({"name": "b", "selector": ".b"})
+
+    assert pm.load_profiles() == [{"name": "a", "selector": ".a"}]
@@ -46,7 +46,7 @@ def test_image_scraper_adds_to_storage(tmp_path, monkeypatch):
 
     monkeypatch.setattr(
         "MOTEUR.scraping.widgets.image_worker.scrape_images",
-        lambda url, sel, folder, keep_driver=False: (0, DummyDriver()),
+        lambda url, sel, folder, keep_driver=False, **_: (0, DummyDriver()),
     )
     monkeypatch.setattr(
         "MOTEUR.scraping.widgets.image_worker.scrape_variants",
@@ -54,7 +54,7 @@ def test_image_scraper_adds_to_storage(tmp_path, monkeypatch):
     )
 
     widget._start()
-    while widget._thread.isRunning():
+    while widget.is_running():
         app.processEvents()
 
     assert storage.table.rowCount() == 1
@@ -0,0 +1,40 @@
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from localapp import utils_collect as uc
+
+
+def _tree(root: Path) -> None:
+    (root / "pkg").mkdir()
+    (root / "pkg" / "mod.py").write_text("x = 1\n", encoding="utf-8")
+    (root / "README.md").write_text("doc\n", encoding="utf-8")
+    (root / "copy.txt").write_text("ancien\n", encoding="utf-8")
+    (root / "image.png").write_bytes(b"\x89PNG")
+    (root / "big.txt").write_bytes(b"a" * (uc.MAX_BYTES + 1))
+    for ignored in ("__pycache__", ".git", "node_modules"):
+        (root / ignored).mkdir()
+        (root / ignored / "skip.py").write_text("y = 2\n", encoding="utf-8")
+
+
+def test_iter_sources_filters(tmp_path: Path):
+    _tree(tmp_path)
+    found = {
+        p.relative_to(tmp_path).as_posix()
+        for p in uc.iter_sources(tmp_path, out_path=tmp_path / "copy.txt")
+    }
+    # copy.txt exclu, dossiers ignorés, extension non listée et fichier trop gros
+    assert found == {"pkg/mod.py", "README.md"}
+
+
+def test_iter_sources_relative_root_excludes_out_path(tmp_path: Path, monkeypatch):
+    _tree(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    found = {
+        Path(p).as_posix()
+        for p in uc.iter_sources(Path("."), out_path=Path("copy.txt"))
+    }
+    assert found == {"pkg/mod.py", "README.md"}
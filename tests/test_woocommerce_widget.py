@@ -237,14 +237,14 @@ def test_check_urls_head_fallback(tmp_path, monkeypatch):
         def __init__(self, code):
             self.status_code = code
 
-    def fake_head(url, timeout, allow_redirects=True):
+    def fake_head(self, url, timeout, allow_redirects=True):
         return Resp(405)
 
-    def fake_get(url, timeout, stream=True, headers=None):
+    def fake_get(self, url, timeout, stream=True, headers=None):
         return Resp(200)
 
-    monkeypatch.setattr("requests.head", fake_head)
-    monkeypatch.setattr("requests.get", fake_get)
+    monkeypatch.setattr("requests.Session.head", fake_head)
+    monkeypatch.setattr("requests.Session.get", fake_get)
 
     widget.check_urls()
     with open(outfile, newline="", encoding="utf-8") as f:
@@ -193,13 +193,13 @@ def _extract_color(row: Dict[str, str]) -> str | None:
     """
     sku = row.get("SKU", "")
     if sku and "-" in sku:
-        candidate = sku.rsplit("-", 1)[1]
+        candidate = sku.rpartition("-")[2]
         colour = _normalize_color(candidate)
         if colour:
             return colour
     name = row.get("Name", "")
     if name:
-        candidate = name.split()[-1]
+        candidate = name.rsplit(None, 1)[-1]
         colour = _normalize_color(candidate)
         if colour:
             return colour
@@ -265,7 +265,7 @@ def transform_woocommerce_rows(rows: Iterable[Dict[str, str]]) -> List[Dict[str,
                     combined.append(img)
             parent_images[sku] = combined
         elif r_type == "variation":
-            parent_sku = sku.rsplit("-", 1)[0] if "-" in sku else ""
+            parent_sku = sku.rpartition("-")[0]
             r["Parent"] = parent_sku
             colour = _extract_color(r)
             if colour:
@@ -315,7 +315,7 @@ def write_woocommerce_csv(
     delimiter: str = CSV_DELIM,
 ) -> None:
     """Write transformed rows to ``path`` with UTF-8 encoding and no BOM."""
-    with open(path, "w", encoding="utf-8", newline="") as f:
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 18) as f:
         writer = csv.DictWriter(
             f, fieldnames=COLUMNS, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL
         )